@@ -8,7 +8,12 @@ __version__ = "0.4.1"
 __author__ = "starward contributors"
 
 # Convenient imports for library usage
-from starward.core.angles import Angle, angular_separation, position_angle
+from starward.core.angles import (
+    Angle,
+    angular_separation,
+    position_angle,
+    separation_and_position_angle,
+)
 from starward.core.time import JulianDate, jd_now, utc_to_jd, jd_to_utc
 from starward.core.coords import (
     ICRSCoord,
@@ -38,6 +43,7 @@ __all__ = [
     "Angle",
     "angular_separation",
     "position_angle",
+    "separation_and_position_angle",
     # Time
     "JulianDate",
     "jd_now",
@@ -4,35 +4,55 @@ Command Line Interface for starward.
 Per aspera ad astra — Through hardships to the stars
 """
 
+import importlib
+
 import click
 from typing import Optional
 
 from starward import __version__
-from starward.cli.time_cmd import time_group
-from starward.cli.coords_cmd import coords_group
-from starward.cli.angles_cmd import angles_group
-from starward.cli.constants_cmd import constants_group
-from starward.cli.sun_cmd import sun_group
-from starward.cli.observer_cmd import observer_group
-from starward.cli.moon_cmd import moon_group
-from starward.cli.vis_cmd import vis_group
-from starward.cli.planets_cmd import planets_group
-from starward.cli.messier_cmd import messier_group
-from starward.cli.ngc_cmd import ngc_group
-from starward.cli.ic_cmd import ic_group
-from starward.cli.stars_cmd import stars_group
-from starward.cli.caldwell_cmd import caldwell_group
-from starward.cli.finder_cmd import find_group
-from starward.cli.list_cmd import list_group
 from starward.core.precision import set_precision, PrecisionLevel
 
 
+# Command groups are imported only when invoked: name -> (module, attribute).
+# Most invocations touch a single subtree, so the rest never load.
+LAZY_COMMANDS = {
+    'time': ('starward.cli.time_cmd', 'time_group'),
+    'coords': ('starward.cli.coords_cmd', 'coords_group'),
+    'angles': ('starward.cli.angles_cmd', 'angles_group'),
+    'constants': ('starward.cli.constants_cmd', 'constants_group'),
+    'sun': ('starward.cli.sun_cmd', 'sun_group'),
+    'observer': ('starward.cli.observer_cmd', 'observer_group'),
+    'moon': ('starward.cli.moon_cmd', 'moon_group'),
+    'vis': ('starward.cli.vis_cmd', 'vis_group'),
+    'planets': ('starward.cli.planets_cmd', 'planets_group'),
+    'messier': ('starward.cli.messier_cmd', 'messier_group'),
+    'ngc': ('starward.cli.ngc_cmd', 'ngc_group'),
+    'ic': ('starward.cli.ic_cmd', 'ic_group'),
+    'stars': ('starward.cli.stars_cmd', 'stars_group'),
+    'caldwell': ('starward.cli.caldwell_cmd', 'caldwell_group'),
+    'find': ('starward.cli.finder_cmd', 'find_group'),
+    'list': ('starward.cli.list_cmd', 'list_group'),
+}
+
+
 class AliasedGroup(click.Group):
-    """Click group with command aliases."""
+    """Click group with command aliases and lazily imported subcommands."""
+    
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(LAZY_COMMANDS))
+    
+    def _resolve(self, ctx, cmd_name):
+        rv = click.Group.get_command(self, ctx, cmd_name)
+        if rv is None and cmd_name in LAZY_COMMANDS:
+            module_name, attr = LAZY_COMMANDS[cmd_name]
+            rv = getattr(importlib.import_module(module_name), attr)
+            # Registered once, so later lookups are a dict hit
+            self.add_command(rv, cmd_name)
+        return rv
     
     def get_command(self, ctx, cmd_name):
         # Try exact match first
-        rv = click.Group.get_command(self, ctx, cmd_name)
+        rv = self._resolve(ctx, cmd_name)
         if rv is not None:
             return rv
         
@@ -66,7 +86,7 @@ class AliasedGroup(click.Group):
         }
         
         if cmd_name in aliases:
-            return click.Group.get_command(self, ctx, aliases[cmd_name])
+            return self._resolve(ctx, aliases[cmd_name])
         
         return None
 
@@ -120,25 +140,6 @@ def main(ctx, verbose: bool, json_output: bool, output: str, precision: str):
     set_precision(precision)
 
 
-# Register command groups
-main.add_command(time_group)
-main.add_command(coords_group)
-main.add_command(angles_group)
-main.add_command(constants_group)
-main.add_command(sun_group)
-main.add_command(observer_group)
-main.add_command(moon_group)
-main.add_command(vis_group)
-main.add_command(planets_group)
-main.add_command(messier_group)
-main.add_command(ngc_group)
-main.add_command(ic_group)
-main.add_command(stars_group)
-main.add_command(caldwell_group)
-main.add_command(find_group)
-main.add_command(list_group)
-
-
 @main.command()
 def about():
     """Show information about starward."""
@@ -2,9 +2,12 @@
 Constants-related CLI commands.
 """
 
+import json
+from functools import lru_cache
+
 import click
 
-from starward.core.constants import CONSTANTS
+from starward.core.constants import CONSTANTS, Constant
 
 
 @click.group(name='constants')
@@ -24,94 +27,67 @@ def constants_group():
     pass
 
 
-@constants_group.command(name='list')
-@click.pass_context
-def list_constants(ctx):
-    """List all available constants."""
-    output_fmt = ctx.obj.get('output', 'plain')
-    
-    constants = CONSTANTS.list_all()
-    
-    if output_fmt == 'json':
-        import json
-        data = [
-            {
-                'name': c.name,
-                'value': c.value,
-                'unit': c.unit,
-                'uncertainty': c.uncertainty,
-                'reference': c.reference,
-            }
-            for c in constants
-        ]
-        click.echo(json.dumps(data, indent=2))
+def _constant_dict(c: Constant) -> dict:
+    """JSON-ready mapping for a single constant."""
+    return {
+        'name': c.name,
+        'value': c.value,
+        'unit': c.unit,
+        'uncertainty': c.uncertainty,
+        'reference': c.reference,
+    }
+
+
+def _constant_entry(c: Constant) -> str:
+    """Plain-text listing entry for a single constant."""
+    if c.uncertainty:
+        val_str = f"{c.value:.6g} ± {c.uncertainty:.2g}"
     else:
-        click.echo("\n  Astronomical Constants")
-        click.echo("  " + "═" * 60)
-        
-        for c in constants:
-            if c.uncertainty:
-                val_str = f"{c.value:.6g} ± {c.uncertainty:.2g}"
-            else:
-                val_str = f"{c.value:.10g}"
-            
-            click.echo(f"\n  {c.name}")
-            click.echo(f"    Value:     {val_str} {c.unit}")
-            click.echo(f"    Reference: {c.reference}")
-        
-        click.echo()
+        val_str = f"{c.value:.10g}"
+    return (
+        f"\n  {c.name}\n"
+        f"    Value:     {val_str} {c.unit}\n"
+        f"    Reference: {c.reference}"
+    )
 
 
-@constants_group.command()
-@click.argument('query')
-@click.pass_context
-def search(ctx, query: str):
-    """Search constants by name."""
-    output_fmt = ctx.obj.get('output', 'plain')
-    
+# The constants table is fixed at import time, so each rendered response
+# is a pure function of its arguments and can be memoized.
+
+@lru_cache(maxsize=None)
+def _render_list(fmt: str) -> str:
+    """Render ``constants list`` output."""
+    constants = CONSTANTS.list_all()
+
+    if fmt == 'json':
+        return json.dumps([_constant_dict(c) for c in constants], indent=2)
+
+    lines = ["\n  Astronomical Constants", "  " + "═" * 60]
+    lines.extend(_constant_entry(c) for c in constants)
+    lines.append("")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _render_search(query: str, fmt: str) -> str:
+    """Render ``constants search`` output."""
     results = CONSTANTS.search(query)
-    
-    if output_fmt == 'json':
-        import json
-        data = [
-            {
-                'name': c.name,
-                'value': c.value,
-                'unit': c.unit,
-                'uncertainty': c.uncertainty,
-                'reference': c.reference,
-            }
-            for c in results
-        ]
-        click.echo(json.dumps(data, indent=2))
-    else:
-        if not results:
-            click.echo(f"\n  No constants found matching '{query}'")
-            return
-        
-        click.echo(f"\n  Constants matching '{query}':")
-        click.echo("  " + "─" * 50)
-        
-        for c in results:
-            if c.uncertainty:
-                val_str = f"{c.value:.6g} ± {c.uncertainty:.2g}"
-            else:
-                val_str = f"{c.value:.10g}"
-            
-            click.echo(f"\n  {c.name}")
-            click.echo(f"    Value:     {val_str} {c.unit}")
-            click.echo(f"    Reference: {c.reference}")
-        
-        click.echo()
 
+    if fmt == 'json':
+        return json.dumps([_constant_dict(c) for c in results], indent=2)
 
-@constants_group.command()
-@click.argument('name')
-@click.pass_context
-def show(ctx, name: str):
-    """Show a specific constant by attribute name."""
-    output_fmt = ctx.obj.get('output', 'plain')
-    
+    if not results:
+        return f"\n  No constants found matching '{query}'"
+
+    lines = [f"\n  Constants matching '{query}':", "  " + "─" * 50]
+    lines.extend(_constant_entry(c) for c in results)
+    lines.append("")
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _render_constant(name: str, fmt: str) -> str:
+    """Render ``constants show`` output."""
     # Try to get the constant
     try:
         const = getattr(CONSTANTS, name.upper())
@@ -121,27 +97,19 @@ def show(ctx, name: str):
         if len(results) == 1:
             const = results[0]
         elif len(results) > 1:
-            click.echo(f"\n  Multiple matches for '{name}':")
-            for c in results:
-                click.echo(f"    - {c.name}")
-            return
+            lines = [f"\n  Multiple matches for '{name}':"]
+            lines.extend(f"    - {c.name}" for c in results)
+            return "\n".join(lines)
         else:
-            click.echo(f"\n  Unknown constant: {name}")
-            click.echo("  Use 'starward constants list' to see all constants.")
-            return
-    
-    if output_fmt == 'json':
-        import json
-        data = {
-            'name': const.name,
-            'value': const.value,
-            'unit': const.unit,
-            'uncertainty': const.uncertainty,
-            'reference': const.reference,
-        }
-        click.echo(json.dumps(data, indent=2))
-    else:
-        click.echo(f"""
+            return (
+                f"\n  Unknown constant: {name}\n"
+                "  Use 'starward constants list' to see all constants."
+            )
+
+    if fmt == 'json':
+        return json.dumps(_constant_dict(const), indent=2)
+
+    return f"""
   ╭────────────────────────────────────────────────────╮
   │  {const.name:^48}  │
   ├────────────────────────────────────────────────────┤
@@ -150,4 +118,32 @@ def show(ctx, name: str):
   │  Uncertainty: {str(const.uncertainty or 'exact'):<36}  │
   │  Reference:   {const.reference:<36}  │
   ╰────────────────────────────────────────────────────╯
-""")
+"""
+
+
+def _output_format(ctx) -> str:
+    """Normalize the global output option to a renderer cache key."""
+    return 'json' if ctx.obj.get('output', 'plain') == 'json' else 'plain'
+
+
+@constants_group.command(name='list')
+@click.pass_context
+def list_constants(ctx):
+    """List all available constants."""
+    click.echo(_render_list(_output_format(ctx)))
+
+
+@constants_group.command()
+@click.argument('query')
+@click.pass_context
+def search(ctx, query: str):
+    """Search constants by name."""
+    click.echo(_render_search(query, _output_format(ctx)))
+
+
+@constants_group.command()
+@click.argument('name')
+@click.pass_context
+def show(ctx, name: str):
+    """Show a specific constant by attribute name."""
+    click.echo(_render_constant(name, _output_format(ctx)))
@@ -9,11 +9,35 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 from starward.verbose import VerboseContext, step
 
 
+# Degree/radian conversion factors. They match the factors used by
+# math.radians and math.degrees, so degree round-trips are bit-for-bit
+# unchanged. The other core modules import these rather than defining their
+# own. Other units are scaled to degrees first, as math.radians(hours * 15)
+# was, so they round the same way.
+_RAD_PER_DEG = math.pi / 180.0
+_DEG_PER_RAD = 180.0 / math.pi
+
+
+# Every format Angle.parse() accepts, as one anchored alternation tried in
+# priority order (HMS, DMS, colon, space, plain degrees).
+_NUM = r'\d+(?:\.\d*)?'
+_ANGLE_RE = re.compile(
+    rf"""^(?:
+        (?P<h>[+-]?{_NUM})[hH]\s*(?P<hm>{_NUM})?[mM]?\s*(?P<hs>{_NUM})?[sS]?
+      | (?P<d>[+-]?{_NUM})[dD°]\s*(?P<dm>{_NUM})[′'mM]?\s*(?P<ds>{_NUM})[″"sS]?
+      | (?P<cd>[+-]?{_NUM}):(?P<cm>{_NUM}):(?P<cs>{_NUM})
+      | (?P<sd>[+-]?{_NUM})\s+(?P<sm>{_NUM})\s+(?P<ss>{_NUM})
+      | (?P<deg>[+-]?{_NUM})[dD°]?
+    )$""",
+    re.VERBOSE,
+)
+
+
 @dataclass(frozen=True)
 class Angle:
     """
@@ -29,7 +53,13 @@ class Angle:
         >>> Angle.parse("12h30m00s")
     """
     
+    # Both units are stored at construction so that the hot .radians and
+    # .degrees reads are plain slot loads; __slots__ drops the per-instance
+    # __dict__ (thousands of Angles are built per calculation).
+    __slots__ = ('_radians', '_degrees')
+    
     _radians: float
+    _degrees: float
     
     def __init__(
         self,
@@ -48,29 +78,39 @@ class Angle:
         if radians is not None:
             rad = radians
         elif degrees is not None:
-            rad = math.radians(degrees)
+            rad = degrees * _RAD_PER_DEG
         elif hours is not None:
-            rad = math.radians(hours * 15.0)
+            rad = (hours * 15.0) * _RAD_PER_DEG
         elif arcminutes is not None:
-            rad = math.radians(arcminutes / 60.0)
+            rad = (arcminutes / 60.0) * _RAD_PER_DEG
         elif arcseconds is not None:
-            rad = math.radians(arcseconds / 3600.0)
+            rad = (arcseconds / 3600.0) * _RAD_PER_DEG
         else:
             rad = 0.0
             
         object.__setattr__(self, '_radians', rad)
+        object.__setattr__(self, '_degrees', rad * _DEG_PER_RAD)
+    
+    # Slotted frozen instances need explicit state for copy/pickle
+    def __getstate__(self) -> float:
+        return self._radians
+    
+    def __setstate__(self, rad: float) -> None:
+        object.__setattr__(self, '_radians', rad)
+        object.__setattr__(self, '_degrees', rad * _DEG_PER_RAD)
     
     @classmethod
     def from_dms(cls, degrees: float, minutes: float = 0, seconds: float = 0) -> Angle:
         """Create from degrees, arcminutes, arcseconds."""
-        sign = -1 if degrees < 0 or (degrees == 0 and str(degrees).startswith('-')) else 1
+        # copysign also carries the sign of -0.0, as in "-00d30m00s"
+        sign = math.copysign(1.0, degrees)
         total = abs(degrees) + minutes / 60 + seconds / 3600
         return cls(degrees=sign * total)
     
     @classmethod
     def from_hms(cls, hours: float, minutes: float = 0, seconds: float = 0) -> Angle:
         """Create from hours, minutes, seconds."""
-        sign = -1 if hours < 0 else 1
+        sign = math.copysign(1.0, hours)
         total = abs(hours) + minutes / 60 + seconds / 3600
         return cls(hours=sign * total)
     
@@ -86,51 +126,20 @@ class Angle:
             - "45:30:00" — DMS (assumed)
             - "+45 30 00" — DMS with spaces
         """
-        value = value.strip()
-        
-        # Check for HMS format (hours)
-        hms_pattern = r'^([+-]?\d+(?:\.\d*)?)[hH]\s*(\d+(?:\.\d*)?)?[mM]?\s*(\d+(?:\.\d*)?)?[sS]?$'
-        match = re.match(hms_pattern, value)
-        if match:
-            h = float(match.group(1))
-            m = float(match.group(2) or 0)
-            s = float(match.group(3) or 0)
-            return cls.from_hms(h, m, s)
-        
-        # Check for DMS format
-        dms_pattern = r'^([+-]?\d+(?:\.\d*)?)[dD°]\s*(\d+(?:\.\d*)?)[\′\'mM]?\s*(\d+(?:\.\d*)?)[\″\"sS]?$'
-        match = re.match(dms_pattern, value)
-        if match:
-            d = float(match.group(1))
-            m = float(match.group(2) or 0)
-            s = float(match.group(3) or 0)
-            return cls.from_dms(d, m, s)
+        match = _ANGLE_RE.match(value.strip())
+        if match is None:
+            raise ValueError(f"Cannot parse angle: {value.strip()!r}")
         
-        # Check for colon-separated (assume DMS)
-        colon_pattern = r'^([+-]?\d+(?:\.\d*)?):(\d+(?:\.\d*)?):(\d+(?:\.\d*)?)$'
-        match = re.match(colon_pattern, value)
-        if match:
-            d = float(match.group(1))
-            m = float(match.group(2))
-            s = float(match.group(3))
-            return cls.from_dms(d, m, s)
-        
-        # Check for space-separated (assume DMS)
-        space_pattern = r'^([+-]?\d+(?:\.\d*)?)\s+(\d+(?:\.\d*)?)\s+(\d+(?:\.\d*)?)$'
-        match = re.match(space_pattern, value)
-        if match:
-            d = float(match.group(1))
-            m = float(match.group(2))
-            s = float(match.group(3))
-            return cls.from_dms(d, m, s)
-        
-        # Plain number (degrees)
-        plain_pattern = r'^([+-]?\d+(?:\.\d*)?)[dD°]?$'
-        match = re.match(plain_pattern, value)
-        if match:
-            return cls(degrees=float(match.group(1)))
-        
-        raise ValueError(f"Cannot parse angle: {value!r}")
+        g = match.group
+        if g('h') is not None:
+            return cls.from_hms(float(g('h')), float(g('hm') or 0), float(g('hs') or 0))
+        if g('d') is not None:
+            return cls.from_dms(float(g('d')), float(g('dm')), float(g('ds')))
+        if g('cd') is not None:
+            return cls.from_dms(float(g('cd')), float(g('cm')), float(g('cs')))
+        if g('sd') is not None:
+            return cls.from_dms(float(g('sd')), float(g('sm')), float(g('ss')))
+        return cls(degrees=float(g('deg')))
     
     # Properties for different units
     @property
@@ -141,7 +150,7 @@ class Angle:
     @property
     def degrees(self) -> float:
         """Angle in decimal degrees."""
-        return math.degrees(self._radians)
+        return self._degrees
     
     @property
     def hours(self) -> float:
@@ -160,33 +169,19 @@ class Angle:
     
     def to_dms(self) -> tuple[int, int, float]:
         """Convert to (degrees, arcminutes, arcseconds)."""
-        total_seconds = abs(self.arcseconds)
-        degrees = int(total_seconds // 3600)
-        remaining = total_seconds % 3600
-        minutes = int(remaining // 60)
-        seconds = remaining % 60
-        
-        if self._radians < 0:
-            degrees = -degrees
-        
-        return degrees, minutes, seconds
+        degrees, remaining = divmod(abs(self.arcseconds), 3600)
+        minutes, seconds = divmod(remaining, 60)
+        return int(math.copysign(degrees, self._radians)), int(minutes), seconds
     
     def to_hms(self) -> tuple[int, int, float]:
         """Convert to (hours, minutes, seconds)."""
-        total_seconds = abs(self.hours * 3600)
-        hours = int(total_seconds // 3600)
-        remaining = total_seconds % 3600
-        minutes = int(remaining // 60)
-        seconds = remaining % 60
-        
-        if self._radians < 0:
-            hours = -hours
-            
-        return hours, minutes, seconds
+        hours, remaining = divmod(abs(self.hours * 3600), 3600)
+        minutes, seconds = divmod(remaining, 60)
+        return int(math.copysign(hours, self._radians)), int(minutes), seconds
     
     def format_dms(self, precision: int = 2, unicode: bool = True) -> str:
         """Format as degrees, arcminutes, arcseconds string."""
-        d, m, s = self.to_dms()
+        d, m, s = _carry_seconds(*self.to_dms(), precision, self._radians < 0)
         
         if unicode:
             sign = "" if d >= 0 or (d == 0 and self._radians >= 0) else "-"
@@ -197,38 +192,37 @@ class Angle:
     
     def format_hms(self, precision: int = 2, unicode: bool = True) -> str:
         """Format as hours, minutes, seconds string."""
-        h, m, s = self.to_hms()
+        h, m, s = _carry_seconds(*self.to_hms(), precision, self._radians < 0)
         
         if unicode:
             return f"{h}ʰ {m:02d}ᵐ {s:0{precision+3}.{precision}f}ˢ"
         else:
             return f"{h}h {m:02d}m {s:0{precision+3}.{precision}f}s"
     
-    # Arithmetic
+    # Arithmetic (operands are already Angles, so skip __init__'s validation)
     def __add__(self, other: Angle) -> Angle:
         if not isinstance(other, Angle):
             return NotImplemented
-        return Angle(radians=self._radians + other._radians)
+        return _from_radians(self._radians + other._radians)
     
     def __sub__(self, other: Angle) -> Angle:
         if not isinstance(other, Angle):
             return NotImplemented
-        return Angle(radians=self._radians - other._radians)
+        return _from_radians(self._radians - other._radians)
     
     def __mul__(self, scalar: float) -> Angle:
-        return Angle(radians=self._radians * scalar)
+        return _from_radians(self._radians * scalar)
     
-    def __rmul__(self, scalar: float) -> Angle:
-        return self.__mul__(scalar)
+    __rmul__ = __mul__
     
     def __truediv__(self, scalar: float) -> Angle:
-        return Angle(radians=self._radians / scalar)
+        return _from_radians(self._radians / scalar)
     
     def __neg__(self) -> Angle:
-        return Angle(radians=-self._radians)
+        return _from_radians(-self._radians)
     
     def __abs__(self) -> Angle:
-        return Angle(radians=abs(self._radians))
+        return _from_radians(abs(self._radians))
     
     # Comparison
     def __eq__(self, other: object) -> bool:
@@ -281,6 +275,49 @@ class Angle:
         return math.tan(self._radians)
 
 
+def _carry_seconds(whole: int, minutes: int, seconds: float,
+                   precision: int, negative: bool) -> Tuple[int, int, float]:
+    """
+    Round seconds to the display precision, carrying a rounded 60 upward.
+    
+    Keeps e.g. 0h 59m 59.999999s from printing as "0ʰ 59ᵐ 60.00ˢ".
+    """
+    seconds = round(seconds, precision)
+    if seconds >= 60:
+        seconds -= 60
+        minutes += 1
+        if minutes == 60:
+            minutes = 0
+            whole += -1 if negative else 1
+    return whole, minutes, seconds
+
+
+def _from_radians(rad: float) -> Angle:
+    """Build an Angle from a radian value known to be valid, bypassing __init__."""
+    angle = object.__new__(Angle)
+    angle.__setstate__(rad)
+    return angle
+
+
+def _separation_radians(λ1: float, φ1: float, λ2: float, φ2: float) -> float:
+    """
+    Vincenty angular separation on raw radians.
+    
+    Float-only kernel behind angular_separation(), for callers that already
+    hold right ascensions and declinations as bare numbers.
+    """
+    sin_φ1, cos_φ1 = math.sin(φ1), math.cos(φ1)
+    sin_φ2, cos_φ2 = math.sin(φ2), math.cos(φ2)
+    Δλ = λ2 - λ1
+    sin_Δλ, cos_Δλ = math.sin(Δλ), math.cos(Δλ)
+    
+    term1 = cos_φ2 * sin_Δλ
+    term2 = cos_φ1 * sin_φ2 - sin_φ1 * cos_φ2 * cos_Δλ
+    
+    return math.atan2(math.sqrt(term1 * term1 + term2 * term2),
+                      sin_φ1 * sin_φ2 + cos_φ1 * cos_φ2 * cos_Δλ)
+
+
 def angular_separation(
     ra1: Angle, dec1: Angle,
     ra2: Angle, dec2: Angle,
@@ -301,30 +338,31 @@ def angular_separation(
         Angular separation as an Angle
     """
     # Convert to radians
-    λ1, φ1 = ra1.radians, dec1.radians
-    λ2, φ2 = ra2.radians, dec2.radians
+    λ1, φ1 = ra1._radians, dec1._radians
+    λ2, φ2 = ra2._radians, dec2._radians
+    
+    # No working to show: go straight to the float kernel
+    if not verbose:
+        return Angle(radians=_separation_radians(λ1, φ1, λ2, φ2))
     
-    if verbose:
-        step(verbose, "Input coordinates",
-             f"Point 1: RA = {ra1.format_hms()}, Dec = {dec1.format_dms()}\n"
-             f"Point 2: RA = {ra2.format_hms()}, Dec = {dec2.format_dms()}")
+    step(verbose, "Input coordinates",
+         f"Point 1: RA = {ra1.format_hms()}, Dec = {dec1.format_dms()}\n"
+         f"Point 2: RA = {ra2.format_hms()}, Dec = {dec2.format_dms()}")
     
     # Difference in RA
     Δλ = λ2 - λ1
     
-    if verbose:
-        step(verbose, "RA difference", f"Δλ = {math.degrees(Δλ):.6f}°")
+    step(verbose, "RA difference", f"Δλ = {math.degrees(Δλ):.6f}°")
     
     # Vincenty formula (stable for all separations)
     sin_φ1, cos_φ1 = math.sin(φ1), math.cos(φ1)
     sin_φ2, cos_φ2 = math.sin(φ2), math.cos(φ2)
     sin_Δλ, cos_Δλ = math.sin(Δλ), math.cos(Δλ)
     
-    if verbose:
-        step(verbose, "Trigonometric values",
-             f"sin(φ₁) = {sin_φ1:.10f}, cos(φ₁) = {cos_φ1:.10f}\n"
-             f"sin(φ₂) = {sin_φ2:.10f}, cos(φ₂) = {cos_φ2:.10f}\n"
-             f"sin(Δλ) = {sin_Δλ:.10f}, cos(Δλ) = {cos_Δλ:.10f}")
+    step(verbose, "Trigonometric values",
+         f"sin(φ₁) = {sin_φ1:.10f}, cos(φ₁) = {cos_φ1:.10f}\n"
+         f"sin(φ₂) = {sin_φ2:.10f}, cos(φ₂) = {cos_φ2:.10f}\n"
+         f"sin(Δλ) = {sin_Δλ:.10f}, cos(Δλ) = {cos_Δλ:.10f}")
     
     # Numerator
     term1 = cos_φ2 * sin_Δλ
@@ -334,27 +372,92 @@ def angular_separation(
     # Denominator
     denominator = sin_φ1 * sin_φ2 + cos_φ1 * cos_φ2 * cos_Δλ
     
-    if verbose:
-        step(verbose, "Vincenty formula",
-             f"numerator = √[(cos φ₂ sin Δλ)² + (cos φ₁ sin φ₂ − sin φ₁ cos φ₂ cos Δλ)²]\n"
-             f"          = √[{term1:.10f}² + {term2:.10f}²]\n"
-             f"          = {numerator:.10f}\n\n"
-             f"denominator = sin φ₁ sin φ₂ + cos φ₁ cos φ₂ cos Δλ\n"
-             f"            = {denominator:.10f}")
+    step(verbose, "Vincenty formula",
+         f"numerator = √[(cos φ₂ sin Δλ)² + (cos φ₁ sin φ₂ − sin φ₁ cos φ₂ cos Δλ)²]\n"
+         f"          = √[{term1:.10f}² + {term2:.10f}²]\n"
+         f"          = {numerator:.10f}\n\n"
+         f"denominator = sin φ₁ sin φ₂ + cos φ₁ cos φ₂ cos Δλ\n"
+         f"            = {denominator:.10f}")
     
     # Angular separation
     sep_rad = math.atan2(numerator, denominator)
     result = Angle(radians=sep_rad)
     
-    if verbose:
-        step(verbose, "Result",
-             f"σ = atan2({numerator:.10f}, {denominator:.10f})\n"
-             f"  = {result.degrees:.10f}°\n"
-             f"  = {result.format_dms()}")
+    step(verbose, "Result",
+         f"σ = atan2({numerator:.10f}, {denominator:.10f})\n"
+         f"  = {result.degrees:.10f}°\n"
+         f"  = {result.format_dms()}")
     
     return result
 
 
+def angular_separation_batch(
+    ra1: Sequence[Angle], dec1: Sequence[Angle],
+    ra2: Sequence[Angle], dec2: Sequence[Angle],
+) -> List[Angle]:
+    """
+    Angular separations for parallel sequences of point pairs.
+    
+    Element i is the separation between (ra1[i], dec1[i]) and
+    (ra2[i], dec2[i]), as angular_separation() would return it.
+    
+    Args:
+        ra1, dec1: First points (right ascensions, declinations)
+        ra2, dec2: Second points
+    
+    Returns:
+        List of separations, in input order
+    
+    Raises:
+        ValueError: If the sequences differ in length
+    """
+    n = len(ra1)
+    if not (len(dec1) == len(ra2) == len(dec2) == n):
+        raise ValueError("ra1, dec1, ra2 and dec2 must have the same length")
+    
+    return [
+        Angle(radians=_separation_radians(λ1._radians, φ1._radians, λ2._radians, φ2._radians))
+        for λ1, φ1, λ2, φ2 in zip(ra1, dec1, ra2, dec2)
+    ]
+
+
+def _position_angle_radians(λ1: float, φ1: float, λ2: float, φ2: float) -> float:
+    """
+    Position angle on raw radians, in (-π, π].
+    
+    Float-only kernel behind position_angle(); callers normalize.
+    """
+    cos_φ2 = math.cos(φ2)
+    Δλ = λ2 - λ1
+    return math.atan2(math.sin(Δλ) * cos_φ2,
+                      math.cos(φ1) * math.sin(φ2) - math.sin(φ1) * cos_φ2 * math.cos(Δλ))
+
+
+def _separation_and_position_angle_radians(
+    λ1: float, φ1: float, λ2: float, φ2: float
+) -> Tuple[float, float]:
+    """
+    Vincenty separation and position angle (in (-π, π]) on raw radians.
+    
+    The position angle's atan2 arguments are exactly the two terms of the
+    Vincenty numerator, so the six sines and cosines are computed once.
+    The arithmetic matches _separation_radians() and
+    _position_angle_radians() term for term, so both results are
+    bit-identical to theirs.
+    """
+    sin_φ1, cos_φ1 = math.sin(φ1), math.cos(φ1)
+    sin_φ2, cos_φ2 = math.sin(φ2), math.cos(φ2)
+    Δλ = λ2 - λ1
+    sin_Δλ, cos_Δλ = math.sin(Δλ), math.cos(Δλ)
+    
+    term1 = cos_φ2 * sin_Δλ
+    term2 = cos_φ1 * sin_φ2 - sin_φ1 * cos_φ2 * cos_Δλ
+    
+    sep = math.atan2(math.sqrt(term1 * term1 + term2 * term2),
+                     sin_φ1 * sin_φ2 + cos_φ1 * cos_φ2 * cos_Δλ)
+    return sep, math.atan2(term1, term2)
+
+
 def position_angle(
     ra1: Angle, dec1: Angle,
     ra2: Angle, dec2: Angle,
@@ -378,13 +481,16 @@ def position_angle(
         Position angle as an Angle in range [0, 360)
     """
     # Convert to radians
-    λ1, φ1 = ra1.radians, dec1.radians
-    λ2, φ2 = ra2.radians, dec2.radians
+    λ1, φ1 = ra1._radians, dec1._radians
+    λ2, φ2 = ra2._radians, dec2._radians
+    
+    # No working to show: go straight to the float kernel
+    if not verbose:
+        return Angle(radians=_position_angle_radians(λ1, φ1, λ2, φ2)).normalize()
     
-    if verbose:
-        step(verbose, "Input coordinates",
-             f"From: RA = {ra1.format_hms()}, Dec = {dec1.format_dms()}\n"
-             f"To:   RA = {ra2.format_hms()}, Dec = {dec2.format_dms()}")
+    step(verbose, "Input coordinates",
+         f"From: RA = {ra1.format_hms()}, Dec = {dec1.format_dms()}\n"
+         f"To:   RA = {ra2.format_hms()}, Dec = {dec2.format_dms()}")
     
     Δλ = λ2 - λ1
     
@@ -392,17 +498,37 @@ def position_angle(
     y = math.sin(Δλ) * math.cos(φ2)
     x = math.cos(φ1) * math.sin(φ2) - math.sin(φ1) * math.cos(φ2) * math.cos(Δλ)
     
-    if verbose:
-        step(verbose, "Position angle formula",
-             f"y = sin(Δλ) × cos(φ₂) = {y:.10f}\n"
-             f"x = cos(φ₁) × sin(φ₂) − sin(φ₁) × cos(φ₂) × cos(Δλ) = {x:.10f}")
+    step(verbose, "Position angle formula",
+         f"y = sin(Δλ) × cos(φ₂) = {y:.10f}\n"
+         f"x = cos(φ₁) × sin(φ₂) − sin(φ₁) × cos(φ₂) × cos(Δλ) = {x:.10f}")
     
     pa_rad = math.atan2(y, x)
     result = Angle(radians=pa_rad).normalize()
     
-    if verbose:
-        step(verbose, "Result",
-             f"PA = atan2({y:.10f}, {x:.10f})\n"
-             f"   = {result.degrees:.6f}°")
+    step(verbose, "Result",
+         f"PA = atan2({y:.10f}, {x:.10f})\n"
+         f"   = {result.degrees:.6f}°")
     
     return result
+
+
+def separation_and_position_angle(
+    ra1: Angle, dec1: Angle,
+    ra2: Angle, dec2: Angle,
+) -> Tuple[Angle, Angle]:
+    """
+    Angular separation and position angle from point 1 to point 2 together.
+    
+    One set of sines and cosines serves both results, and each matches
+    what angular_separation() and position_angle() return on their own.
+    
+    Args:
+        ra1, dec1: First point (origin)
+        ra2, dec2: Second point (target)
+    
+    Returns:
+        (separation, position angle in [0, 360))
+    """
+    sep, pa = _separation_and_position_angle_radians(ra1._radians, dec1._radians,
+                                                     ra2._radians, dec2._radians)
+    return _from_radians(sep), _from_radians(pa).normalize()
@@ -7,7 +7,8 @@ All values sourced from IAU 2015 Resolution B3 and CODATA 2018 unless noted.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -305,16 +306,30 @@ class AstronomicalConstants:
     
     def list_all(self) -> List[Constant]:
         """Return all constants as a list."""
-        return [
-            getattr(self, name) 
-            for name in dir(self) 
-            if isinstance(getattr(self, name), Constant)
-        ]
+        # A fresh list each call (callers may mutate it); copying a tuple
+        # is several times cheaper than materializing dict values
+        return list(_ALL_CONSTANTS)
     
     def search(self, query: str) -> List[Constant]:
         """Search constants by name."""
-        query = query.lower()
-        return [c for c in self.list_all() if query in c.name.lower()]
+        return list(_search(query.lower()))
+
+
+# The table is fixed at import, so index it once: attribute name -> Constant
+# (sorted as dir() would list them), plus lowercased names for search().
+_REGISTRY: Dict[str, Constant] = {
+    attr: value
+    for attr, value in sorted(vars(AstronomicalConstants).items())
+    if isinstance(value, Constant)
+}
+_ALL_CONSTANTS = tuple(_REGISTRY.values())
+_SEARCH_NAMES = tuple((c, c.name.lower()) for c in _ALL_CONSTANTS)
+
+
+@lru_cache(maxsize=256)
+def _search(query: str) -> Tuple[Constant, ...]:
+    """Constants whose lowercased name contains query (memoized per query)."""
+    return tuple(c for c, name in _SEARCH_NAMES if query in name)
 
 
 # Singleton instance
@@ -7,16 +7,101 @@ Supports ICRS (J2000 equatorial), Galactic, Ecliptic, and Horizontal (Alt/Az).
 from __future__ import annotations
 
 import math
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Union
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
-from starward.core.angles import Angle
+from starward.core.angles import Angle, _RAD_PER_DEG, _from_radians
 from starward.core.constants import CONSTANTS
 from starward.core.time import JulianDate
 from starward.verbose import VerboseContext, step
 
 
+# North Galactic Pole in J2000.0 equatorial coordinates, and the galactic
+# longitude of the North Celestial Pole (IAU 1958 system precessed to J2000.0)
+_RA_NGP = math.radians(192.8594813)    # 12h 51m 26.28s
+_DEC_NGP = math.radians(27.1282511)    # +27° 07' 41.7"
+_L_NCP = math.radians(122.9319185)
+_SIN_DEC_NGP = math.sin(_DEC_NGP)
+_COS_DEC_NGP = math.cos(_DEC_NGP)
+
+_HALF_PI = math.pi / 2
+
+# ICRSCoord.parse fallback: split "RA Dec" where Dec starts at its sign/digit
+_COORD_SPLIT_RE = re.compile(r'^(.+?)\s*([+-]?\d.*)$')
+
+
+def _galactic_matrix() -> Tuple[Tuple[float, float, float], ...]:
+    """
+    ICRS → Galactic rotation matrix (rows are the galactic axes in ICRS).
+    
+    Rotate about z by the NGP right ascension, tilt the NGP onto the pole,
+    then spin about the new pole so the NCP lands at galactic longitude l_NCP.
+    """
+    sin_a, cos_a = math.sin(_RA_NGP), math.cos(_RA_NGP)
+    sin_d, cos_d = _SIN_DEC_NGP, _COS_DEC_NGP
+    sin_t, cos_t = math.sin(_L_NCP), math.cos(_L_NCP)
+    
+    tilt = (sin_d * cos_a, sin_d * sin_a, -cos_d)
+    east = (-sin_a, cos_a, 0.0)
+    pole = (cos_d * cos_a, cos_d * sin_a, sin_d)
+    
+    return (
+        tuple(-cos_t * t + sin_t * e for t, e in zip(tilt, east)),
+        tuple(-sin_t * t - cos_t * e for t, e in zip(tilt, east)),
+        pole,
+    )
+
+
+_GALACTIC_MATRIX = _galactic_matrix()
+_GALACTIC_MATRIX_T = tuple(zip(*_GALACTIC_MATRIX))   # inverse: Galactic → ICRS
+
+
+@lru_cache(maxsize=64)
+def _horizontal_matrix(jd: float, lat: float, lon_deg: float) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    ICRS → horizontal rotation matrix for one instant and observer.
+    
+    Rows are the local north, east and zenith axes in equatorial
+    coordinates, so (lon, lat) out of _rotate_spherical() is (az, alt).
+    Memoized: a catalog observed from one site at one time shares it.
+    """
+    lst = JulianDate(jd).lst(lon_deg) * (math.pi / 12.0)
+    sin_l, cos_l = math.sin(lst), math.cos(lst)
+    sin_φ, cos_φ = math.sin(lat), math.cos(lat)
+    
+    return (
+        (-sin_φ * cos_l, -sin_φ * sin_l, cos_φ),
+        (-sin_l, cos_l, 0.0),
+        (cos_φ * cos_l, cos_φ * sin_l, sin_φ),
+    )
+
+
+def _rotate_spherical(matrix, lon: float, lat: float,
+                      _sin=math.sin, _cos=math.cos, _atan2=math.atan2,
+                      _hypot=math.hypot, _two_pi=2 * math.pi) -> Tuple[float, float]:
+    """
+    Rotate a (lon, lat) direction in radians by a 3×3 rotation matrix.
+    
+    Returns (lon, lat) with lon in [0, 2π); lon is 0 at the poles, where it
+    is undefined. The math functions are bound as default arguments (local
+    loads) since every quiet galactic and horizontal transform lands here.
+    """
+    cos_lat = _cos(lat)
+    x, y, z = cos_lat * _cos(lon), cos_lat * _sin(lon), _sin(lat)
+    (a, b, c), (d, e, f), (g, h, i) = matrix
+    
+    u = a * x + b * y + c * z
+    v = d * x + e * y + f * z
+    w = g * x + h * y + i * z
+    
+    rho = _hypot(u, v)
+    new_lon = _atan2(v, u) % _two_pi if rho >= 1e-10 else 0.0
+    return new_lon, _atan2(w, rho)
+
+
 class Coordinate(ABC):
     """Base class for all coordinate types."""
     
@@ -75,6 +160,7 @@ class ICRSCoord(Coordinate):
         )
     
     @classmethod
+    @lru_cache(maxsize=256)
     def parse(cls, value: str) -> ICRSCoord:
         """
         Parse ICRS coordinates from string.
@@ -83,28 +169,34 @@ class ICRSCoord(Coordinate):
             - "12h30m00s +45d30m00s"
             - "12:30:00 +45:30:00"
             - "187.5 45.5"
+        
+        Results are cached per string (coordinates are immutable), so
+        catalogs and fixtures that re-parse the same literal pay once.
         """
-        parts = value.strip().split()
+        text = value.strip()
+        parts = text.split()
         
         if len(parts) == 2:
             ra_str, dec_str = parts
         else:
             # Try to find the split point (usually at +/- for dec)
-            import re
-            match = re.match(r'^(.+?)\s*([+-]?\d.*)$', value.strip())
+            match = _COORD_SPLIT_RE.match(text)
             if match:
                 ra_str, dec_str = match.groups()
             else:
                 raise ValueError(f"Cannot parse coordinates: {value!r}")
         
         # Check if RA is in HMS format
-        if 'h' in ra_str.lower() or ':' in ra_str:
+        if 'h' in ra_str or 'H' in ra_str:
             ra = Angle.parse(ra_str)
-            # If parsed as degrees (from colon format), might need conversion
-            if ':' in ra_str and 'h' not in ra_str.lower():
-                # Assume colon format for RA is HMS
-                parts = ra_str.split(':')
-                ra = Angle.from_hms(float(parts[0]), float(parts[1]), float(parts[2]))
+        elif ':' in ra_str:
+            # Assume colon format for RA is HMS; split it directly rather
+            # than letting Angle.parse read it as DMS first
+            try:
+                h, m, s = ra_str.split(':')
+                ra = Angle.from_hms(float(h), float(m), float(s))
+            except ValueError:
+                raise ValueError(f"Cannot parse angle: {ra_str!r}") from None
         else:
             # Plain number, assume degrees
             ra = Angle(degrees=float(ra_str))
@@ -179,14 +271,15 @@ class GalacticCoord(Coordinate):
     
     def to_icrs(self, verbose: Optional[VerboseContext] = None) -> ICRSCoord:
         """Convert to ICRS coordinates using matrix transformation."""
-        # Use the standard rotation matrix approach
+        # No working to show: one multiply by the precomputed rotation matrix
+        if not verbose:
+            ra, dec = _rotate_spherical(_GALACTIC_MATRIX_T, self.l._radians, self.b._radians)
+            return ICRSCoord(Angle(radians=ra), Angle(radians=dec))
+        
+        # Spelled-out spherical trigonometry for the verbose walkthrough
         # Reference: "Practical Astronomy with your Calculator" by Duffett-Smith
         # and IAU 1958 Galactic coordinate system, precessed to J2000.0
-        
-        # North Galactic Pole in J2000.0 equatorial coordinates
-        ra_ngp = math.radians(192.8594813)   # 12h 51m 26.28s
-        dec_ngp = math.radians(27.1282511)   # +27° 07' 41.7"
-        l_ncp = math.radians(122.9319185)    # galactic longitude of NCP
+        ra_ngp, dec_ngp, l_ncp = _RA_NGP, _DEC_NGP, _L_NCP
         
         if verbose:
             step(verbose, "Reference frame parameters",
@@ -205,8 +298,8 @@ class GalacticCoord(Coordinate):
         # Compute intermediate values
         sin_b = math.sin(b_rad)
         cos_b = math.cos(b_rad)
-        sin_dec_ngp = math.sin(dec_ngp)
-        cos_dec_ngp = math.cos(dec_ngp)
+        sin_dec_ngp = _SIN_DEC_NGP
+        cos_dec_ngp = _COS_DEC_NGP
         
         l_minus_lncp = l_rad - l_ncp
         sin_l_lncp = math.sin(l_minus_lncp)
@@ -262,10 +355,12 @@ class GalacticCoord(Coordinate):
         **kwargs
     ) -> GalacticCoord:
         """Convert from ICRS coordinates using standard spherical trig."""
-        # North Galactic Pole in J2000.0 equatorial coordinates
-        ra_ngp = math.radians(192.8594813)   # 12h 51m 26.28s
-        dec_ngp = math.radians(27.1282511)   # +27° 07' 41.7"
-        l_ncp = math.radians(122.9319185)    # galactic longitude of NCP
+        # No working to show: one multiply by the precomputed rotation matrix
+        if not verbose:
+            l_rad, b = _rotate_spherical(_GALACTIC_MATRIX, coord.ra._radians, coord.dec._radians)
+            return cls(Angle(radians=l_rad), Angle(radians=b))
+        
+        ra_ngp, dec_ngp, l_ncp = _RA_NGP, _DEC_NGP, _L_NCP
         
         if verbose:
             step(verbose, "Input ICRS coordinates",
@@ -282,8 +377,8 @@ class GalacticCoord(Coordinate):
         # Compute intermediate values
         sin_dec = math.sin(dec)
         cos_dec = math.cos(dec)
-        sin_dec_ngp = math.sin(dec_ngp)
-        cos_dec_ngp = math.cos(dec_ngp)
+        sin_dec_ngp = _SIN_DEC_NGP
+        cos_dec_ngp = _COS_DEC_NGP
         
         ra_minus_rangp = ra - ra_ngp
         sin_ra_rangp = math.sin(ra_minus_rangp)
@@ -401,6 +496,19 @@ class HorizontalCoord(Coordinate):
         if jd is None or lat is None or lon is None:
             raise ValueError("jd, lat, and lon are required for ICRS to Horizontal conversion")
         
+        if not verbose:
+            # A celestial pole sits at a fixed alt/az whatever the time
+            # (alt = ±latitude, due north/south), so skip the LST entirely
+            dec = coord.dec.radians
+            if abs(dec) > _HALF_PI - 1e-9:
+                if dec > 0:
+                    return cls(Angle(radians=lat.radians), Angle(radians=0.0))
+                return cls(Angle(radians=-lat.radians), Angle(radians=math.pi))
+            
+            matrix = _horizontal_matrix(jd.jd, lat.radians, lon.degrees)
+            az_rad, alt_rad = _rotate_spherical(matrix, coord.ra.radians, coord.dec.radians)
+            return cls(Angle(radians=alt_rad), Angle(radians=az_rad))
+        
         if verbose:
             step(verbose, "Input parameters",
                  f"ICRS: RA = {coord.ra.format_hms()}, Dec = {coord.dec.format_dms()}\n"
@@ -477,20 +585,16 @@ class HorizontalCoord(Coordinate):
         More accurate than sec(z) for high airmass values.
         Valid for altitudes > 0°.
         """
-        if self.alt.degrees <= 0:
-            return float('inf')
-        
         # Pickering (2002) formula - works well down to horizon
-        alt_deg = self.alt.degrees
-        # Avoid division issues very close to horizon
-        if alt_deg < 0.1:
+        h = self.alt.degrees
+        # Below the horizon, and avoid division issues very close to it
+        if h < 0.1:
             return float('inf')
         
         # Pickering formula: 1 / sin(h + 244/(165 + 47*h^1.1))
         # where h is altitude in degrees
-        h = alt_deg
         denominator = h + 244.0 / (165.0 + 47.0 * (h ** 1.1))
-        return 1.0 / math.sin(math.radians(denominator))
+        return 1.0 / math.sin(denominator * _RAD_PER_DEG)
     
     @property
     def zenith_angle(self) -> Angle:
@@ -556,3 +660,42 @@ def transform_coords(
         return HorizontalCoord.from_icrs(icrs, verbose=verbose, **kwargs)
     else:
         raise ValueError(f"Unknown coordinate system: {to_system}")
+
+
+def icrs_to_galactic_batch(coords: Sequence[ICRSCoord]) -> List[GalacticCoord]:
+    """
+    Convert a sequence of ICRS coordinates to Galactic in one pass.
+    
+    Element i is coords[i].to_galactic(), computed on raw radians without
+    building the intermediate Angles of the scalar path.
+    
+    Args:
+        coords: ICRS coordinates
+    
+    Returns:
+        List of Galactic coordinates, in input order
+    """
+    galactic = []
+    for c in coords:
+        l_rad, b_rad = _rotate_spherical(_GALACTIC_MATRIX, c.ra._radians, c.dec._radians)
+        galactic.append(GalacticCoord(_from_radians(l_rad), _from_radians(b_rad)))
+    return galactic
+
+
+def galactic_to_icrs_batch(coords: Sequence[GalacticCoord]) -> List[ICRSCoord]:
+    """
+    Convert a sequence of Galactic coordinates to ICRS in one pass.
+    
+    Element i is coords[i].to_icrs(); see icrs_to_galactic_batch().
+    
+    Args:
+        coords: Galactic coordinates
+    
+    Returns:
+        List of ICRS coordinates, in input order
+    """
+    icrs = []
+    for c in coords:
+        ra_rad, dec_rad = _rotate_spherical(_GALACTIC_MATRIX_T, c.l._radians, c.b._radians)
+        icrs.append(ICRSCoord(_from_radians(ra_rad), _from_radians(dec_rad)))
+    return icrs
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from functools import lru_cache
+from typing import Optional, Tuple, List, Sequence
 from enum import Enum
 
 from starward.core.angles import Angle
@@ -32,6 +33,10 @@ class MoonPhase(Enum):
     WANING_CRESCENT = "Waning Crescent"
 
 
+# Named phases in octant order (0° = new, 45° steps), for index lookup
+_PHASE_OCTANTS = tuple(MoonPhase)
+
+
 @dataclass(frozen=True)
 class MoonPosition:
     """Lunar position at a given instant."""
@@ -230,6 +235,36 @@ def moon_position(jd: JulianDate, verbose: Optional[VerboseContext] = None) -> M
     Returns:
         MoonPosition with all calculated parameters
     """
+    # Quiet calls are memoized on the exact JD; verbose calls always show work
+    if verbose is None:
+        return _moon_position_cached(jd.jd)
+    
+    return _moon_position(jd, verbose)
+
+
+def moon_positions(jds: Sequence[JulianDate]) -> List[MoonPosition]:
+    """
+    Calculate the geocentric position of the Moon at each of a sequence of times.
+    
+    Positions are memoized per JD, so repeated instants are free.
+    
+    Args:
+        jds: Julian Dates
+        
+    Returns:
+        List of MoonPosition, in the same order as jds
+    """
+    return [_moon_position_cached(t.jd) for t in jds]
+
+
+@lru_cache(maxsize=1024)
+def _moon_position_cached(jd: float) -> MoonPosition:
+    """Memoized moon_position() for a raw JD (MoonPosition is immutable)."""
+    return _moon_position(JulianDate(jd), None)
+
+
+def _moon_position(jd: JulianDate, verbose: Optional[VerboseContext]) -> MoonPosition:
+    """Evaluate the lunar series for moon_position()."""
     T = _julian_century(jd)
     
     if verbose:
@@ -442,22 +477,8 @@ def moon_phase(jd: JulianDate, verbose: Optional[VerboseContext] = None) -> Moon
     if d < 0:
         d += 360
     
-    if d < 22.5 or d >= 337.5:
-        phase_name = MoonPhase.NEW_MOON
-    elif d < 67.5:
-        phase_name = MoonPhase.WAXING_CRESCENT
-    elif d < 112.5:
-        phase_name = MoonPhase.FIRST_QUARTER
-    elif d < 157.5:
-        phase_name = MoonPhase.WAXING_GIBBOUS
-    elif d < 202.5:
-        phase_name = MoonPhase.FULL_MOON
-    elif d < 247.5:
-        phase_name = MoonPhase.WANING_GIBBOUS
-    elif d < 292.5:
-        phase_name = MoonPhase.LAST_QUARTER
-    else:
-        phase_name = MoonPhase.WANING_CRESCENT
+    # Each named phase spans a 45° octant centred on a multiple of 45°
+    phase_name = _PHASE_OCTANTS[int((d + 22.5) // 45.0) % 8]
     
     # Age in days (synodic month = 29.530589 days)
     synodic = CONSTANTS.SYNODIC_MONTH.value
@@ -504,13 +525,12 @@ def moon_altitude(observer: Observer, jd: JulianDate,
     H = lst - pos.ra.degrees
     H_rad = math.radians(H)
     
-    # Observer latitude
-    phi_rad = math.radians(observer.lat_deg)
+    # Observer latitude (trig cached on the Observer)
     dec_rad = math.radians(pos.dec.degrees)
     
     # Altitude
-    sin_alt = (math.sin(phi_rad) * math.sin(dec_rad) + 
-               math.cos(phi_rad) * math.cos(dec_rad) * math.cos(H_rad))
+    sin_alt = (observer._sin_lat * math.sin(dec_rad) + 
+               observer._cos_lat * math.cos(dec_rad) * math.cos(H_rad))
     alt = math.degrees(math.asin(sin_alt))
     
     # Apply parallax correction (Moon is close enough to matter)
@@ -35,6 +35,16 @@ class Observer:
     elevation: float = 0.0
     timezone: Optional[str] = None
     
+    # Trig of the site latitude, computed once: every altitude/azimuth
+    # evaluation for this observer needs it.
+    _sin_lat: float = field(init=False, repr=False, compare=False)
+    _cos_lat: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        lat_rad = self.latitude.radians
+        object.__setattr__(self, '_sin_lat', math.sin(lat_rad))
+        object.__setattr__(self, '_cos_lat', math.cos(lat_rad))
+    
     @classmethod
     def from_degrees(
         cls,
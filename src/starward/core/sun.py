@@ -9,10 +9,17 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional, Tuple
-
-from starward.core.angles import Angle
-from starward.core.time import JulianDate, jd_now
+from functools import lru_cache
+from typing import Optional, List, Sequence, Tuple
+
+from starward.core.angles import Angle, _DEG_PER_RAD, _RAD_PER_DEG
+from starward.core.time import (
+    JulianDate,
+    jd_now,
+    _JD_J2000,
+    _JULIAN_CENTURY,
+    _local_sidereal_degrees,
+)
 from starward.core.coords import ICRSCoord
 from starward.core.observer import Observer
 from starward.core.constants import CONSTANTS
@@ -309,6 +316,78 @@ def sun_position(jd: Optional[JulianDate] = None, verbose: Optional[VerboseConte
     if jd is None:
         jd = jd_now()
     
+    # Quiet calls are memoized on the exact JD; verbose calls always show work
+    if verbose is None:
+        return _sun_position_cached(jd.jd)
+    
+    return _sun_position(jd, verbose)
+
+
+def sun_positions(jds: Sequence[JulianDate]) -> List[SunPosition]:
+    """
+    Calculate the Sun's position at each of a sequence of times.
+    
+    Positions are memoized per JD, so repeated instants are free.
+    
+    Args:
+        jds: Julian Dates
+        
+    Returns:
+        List of SunPosition, in the same order as jds
+    """
+    return [_sun_position_cached(t.jd) for t in jds]
+
+
+def _sun_equatorial(jd: float) -> Tuple[float, float, float]:
+    """
+    Quiet solar series on floats for a raw JD.
+    
+    Returns (λ, α in degrees, sin δ): apparent ecliptic longitude and
+    right ascension, unnormalized, and the sine of the declination
+    (Meeus 25.2-25.8 and 22.2). Shared by sun_position() and
+    solar_altitude() so the series is written once outside the verbose
+    step functions.
+    """
+    T = (jd - _JD_J2000) / _JULIAN_CENTURY
+    
+    # Apparent ecliptic longitude
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
+    M = (357.52911 + 35999.05029 * T - 0.0001537 * T * T) * _RAD_PER_DEG
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(M) +
+         (0.019993 - 0.000101 * T) * math.sin(2 * M) +
+         0.000289 * math.sin(3 * M))
+    omega = (125.04 - 1934.136 * T) * _RAD_PER_DEG
+    lam_deg = L0 + C - 0.00569 - 0.00478 * math.sin(omega)
+    
+    # True obliquity
+    eps = (
+        (84381.448 - 46.8150 * T - 0.00059 * T * T + 0.001813 * T * T * T) / 3600.0
+        + 0.00256 * math.cos(omega)
+    ) * _RAD_PER_DEG
+    
+    lam = lam_deg * _RAD_PER_DEG
+    sin_lam = math.sin(lam)
+    ra_deg = math.atan2(math.cos(eps) * sin_lam, math.cos(lam)) * _DEG_PER_RAD
+    return lam_deg, ra_deg, math.sin(eps) * sin_lam
+
+
+@lru_cache(maxsize=1024)
+def _sun_position_cached(jd: float) -> SunPosition:
+    """Memoized sun_position() for a raw JD (SunPosition is immutable)."""
+    lam_deg, ra_deg, sin_dec = _sun_equatorial(jd)
+    t = JulianDate(jd)
+    return SunPosition(
+        longitude=Angle(degrees=lam_deg).normalize(),
+        latitude=Angle(degrees=0),
+        ra=Angle(degrees=ra_deg).normalize(),
+        dec=Angle(radians=math.asin(sin_dec)),
+        distance_au=sun_distance(t),
+        equation_of_time=equation_of_time(t)
+    )
+
+
+def _sun_position(jd: JulianDate, verbose: Optional[VerboseContext]) -> SunPosition:
+    """Evaluate the solar series for sun_position()."""
     step(verbose, "Sun position calculation",
          f"JD = {jd.jd:.6f}\n"
          f"T = {jd.t_j2000:.10f} centuries since J2000.0")
@@ -676,6 +755,23 @@ def astronomical_twilight(
     return (morning, evening)
 
 
+def _sun_altitude_degrees(jd: float, sin_lat: float, cos_lat: float, lon_deg: float) -> float:
+    """
+    Solar altitude in degrees, all on floats.
+    
+    _sun_equatorial() followed by the ICRS→horizontal transform, used by
+    solar_altitude() when no working needs to be shown.
+    """
+    _, ra_deg, sin_dec = _sun_equatorial(jd)
+    cos_dec = math.sqrt(1.0 - sin_dec * sin_dec)
+    
+    # Hour angle from local sidereal time
+    H = (_local_sidereal_degrees(jd, lon_deg) - ra_deg) * _RAD_PER_DEG
+    
+    sin_alt = sin_dec * sin_lat + cos_dec * cos_lat * math.cos(H)
+    return math.asin(max(-1.0, min(1.0, sin_alt))) * _DEG_PER_RAD
+
+
 def solar_altitude(
     observer: Observer,
     jd: Optional[JulianDate] = None,
@@ -695,6 +791,11 @@ def solar_altitude(
     if jd is None:
         jd = jd_now()
     
+    if verbose is None:
+        return Angle(degrees=_sun_altitude_degrees(
+            jd.jd, observer._sin_lat, observer._cos_lat, observer.lon_deg
+        ))
+    
     sun = sun_position(jd, verbose)
     coord = sun.to_icrs()
     
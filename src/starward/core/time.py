@@ -9,12 +9,92 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Union
+from functools import cached_property, lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
 from starward.core.constants import CONSTANTS
 from starward.verbose import VerboseContext, step
 
 
+# Epoch constants as plain floats for the hot paths
+_JD_J2000 = float(CONSTANTS.JD_J2000)
+_JULIAN_CENTURY = float(CONSTANTS.JULIAN_CENTURY)
+_MJD_OFFSET = float(CONSTANTS.MJD_OFFSET)
+
+# IAU 2006 GMST polynomial coefficients (seconds, T in Julian centuries)
+_GMST_C0 = 67310.54841
+_GMST_C1 = 876600.0 * 3600 + 8640184.812866
+_GMST_C2 = 0.093104
+_GMST_C3 = -6.2e-6
+
+
+def _gmst_seconds(jd: float) -> float:
+    """
+    Greenwich Mean Sidereal Time in seconds (unreduced) for a raw JD.
+    
+    Float kernel behind JulianDate.gmst and _local_sidereal_degrees(), so
+    every sidereal time in the package comes from the same polynomial.
+    """
+    t = (jd - _JD_J2000) / _JULIAN_CENTURY
+    return _GMST_C0 + t * (_GMST_C1 + t * (_GMST_C2 + t * _GMST_C3))
+
+
+def _local_sidereal_degrees(jd: float, lon_deg: float) -> float:
+    """Local mean sidereal time in degrees [0, 360) for a raw JD."""
+    # 240 seconds of sidereal time per degree
+    return (_gmst_seconds(jd) / 240.0 + lon_deg) % 360.0
+
+
+def _day_fraction(hour: int, minute: int, second: int, microsecond: int) -> float:
+    """Fraction of a day elapsed at a UTC time of day."""
+    return (
+        hour / 24.0 +
+        minute / 1440.0 +
+        second / 86400.0 +
+        microsecond / 86400000000.0
+    )
+
+
+def _gregorian_terms(year: int, month: int) -> Tuple[int, int, int, int]:
+    """
+    (Y, M, A, B) of the Meeus calendar-to-JD formula.
+    
+    January and February count as months 13 and 14 of the previous year;
+    B is the Gregorian calendar correction.
+    """
+    if month <= 2:
+        year -= 1
+        month += 12
+    a = int(year / 100)
+    return year, month, a, 2 - a + int(a / 4)
+
+
+@lru_cache(maxsize=256)
+def _calendar_jd(
+    year: int,
+    month: int,
+    day: int,
+    hour: int,
+    minute: int,
+    second: int,
+    microsecond: int,
+) -> float:
+    """
+    Julian Date of a UTC calendar instant (Meeus, "Astronomical Algorithms").
+    
+    Kernel behind JulianDate.from_datetime, which only adds the working
+    when verbose; memoized because the same instants (J2000.0, observation
+    nights) are converted over and over.
+    """
+    y, m, _, b = _gregorian_terms(year, month)
+    return (
+        int(365.25 * (y + 4716)) +
+        int(30.6001 * (m + 1)) +
+        day + _day_fraction(hour, minute, second, microsecond) +
+        b - 1524.5
+    )
+
+
 @dataclass(frozen=True)
 class JulianDate:
     """
@@ -35,12 +115,12 @@ class JulianDate:
     @classmethod
     def j2000(cls) -> JulianDate:
         """Return the Julian Date of J2000.0 epoch."""
-        return cls(float(CONSTANTS.JD_J2000))
+        return cls(_JD_J2000)
     
     @classmethod
     def from_mjd(cls, mjd: float) -> JulianDate:
         """Create from Modified Julian Date."""
-        return cls(mjd + float(CONSTANTS.MJD_OFFSET))
+        return cls(mjd + _MJD_OFFSET)
     
     @classmethod
     def from_datetime(
@@ -59,50 +139,37 @@ class JulianDate:
         elif dt.tzinfo != timezone.utc:
             dt = dt.astimezone(timezone.utc)
         
-        year = dt.year
-        month = dt.month
-        day = dt.day
-        
-        # Fractional day from hours, minutes, seconds
-        day_fraction = (
-            dt.hour / 24.0 +
-            dt.minute / 1440.0 +
-            dt.second / 86400.0 +
-            dt.microsecond / 86400000000.0
+        jd = _calendar_jd(
+            dt.year, dt.month, dt.day,
+            dt.hour, dt.minute, dt.second, dt.microsecond
         )
         
-        if verbose:
-            step(verbose, "Input datetime",
-                 f"{dt.isoformat()}\n"
-                 f"Year: {year}, Month: {month}, Day: {day}\n"
-                 f"Day fraction: {day_fraction:.10f}")
+        if not verbose:
+            return cls(jd)
         
-        # Algorithm from Meeus, "Astronomical Algorithms"
-        if month <= 2:
-            year -= 1
-            month += 12
+        # Show the working from the same terms _calendar_jd() uses
+        day = dt.day
+        day_fraction = _day_fraction(dt.hour, dt.minute, dt.second, dt.microsecond)
         
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)  # Gregorian calendar correction
+        step(verbose, "Input datetime",
+             f"{dt.isoformat()}\n"
+             f"Year: {dt.year}, Month: {dt.month}, Day: {day}\n"
+             f"Day fraction: {day_fraction:.10f}")
         
-        if verbose:
-            step(verbose, "Calendar correction (Gregorian)",
-                 f"A = int({year + (1 if month > 2 else 0)}/100) = {a}\n"
-                 f"B = 2 - A + int(A/4) = {b}")
-        
-        jd = (
-            int(365.25 * (year + 4716)) +
-            int(30.6001 * (month + 1)) +
-            day + day_fraction +
-            b - 1524.5
-        )
+        # Algorithm from Meeus, "Astronomical Algorithms"
+        year, month, a, b = _gregorian_terms(dt.year, dt.month)
         
-        if verbose:
-            step(verbose, "Julian Date calculation",
-                 f"JD = int(365.25 × (Y + 4716)) + int(30.6001 × (M + 1)) + D + B − 1524.5\n"
-                 f"   = int(365.25 × {year + 4716}) + int(30.6001 × {month + 1}) + {day + day_fraction:.10f} + {b} − 1524.5\n"
-                 f"   = {int(365.25 * (year + 4716))} + {int(30.6001 * (month + 1))} + {day + day_fraction:.10f} + {b} − 1524.5\n"
-                 f"   = {jd:.10f}")
+        step(verbose, "Calendar correction (Gregorian)",
+             f"A = int({year + (1 if month > 2 else 0)}/100) = {a}\n"
+             f"B = 2 - A + int(A/4) = {b}")
+        
+        step(verbose, "Julian Date calculation",
+             f"JD = int(365.25 × (Y + 4716)) + int(30.6001 × (M + 1)) + D + B − 1524.5\n"
+             f"   = int(365.25 × {year + 4716}) + int(30.6001 × {month + 1}) + "
+             f"{day + day_fraction:.10f} + {b} − 1524.5\n"
+             f"   = {int(365.25 * (year + 4716))} + {int(30.6001 * (month + 1))} + "
+             f"{day + day_fraction:.10f} + {b} − 1524.5\n"
+             f"   = {jd:.10f}")
         
         return cls(jd)
     
@@ -126,20 +193,41 @@ class JulianDate:
         )
         return cls.from_datetime(dt, verbose=verbose)
     
-    @property
+    @classmethod
+    def from_calendar_batch(
+        cls,
+        dates: Sequence[Tuple[int, int, int, int, int, float]],
+    ) -> List[JulianDate]:
+        """
+        Create from a sequence of calendar rows (assumed UTC).
+        
+        Each row is (year, month, day, hour, minute, second), as
+        from_calendar() takes them; the result is in input order. Rows are
+        still validated through datetime, but skip the per-call timezone
+        handling of from_datetime().
+        """
+        jds = []
+        for year, month, day, hour, minute, second in dates:
+            whole = int(second)
+            micro = int((second % 1) * 1_000_000)
+            datetime(year, month, day, hour, minute, whole, micro)
+            jds.append(cls(_calendar_jd(year, month, day, hour, minute, whole, micro)))
+        return jds
+    
+    @cached_property
     def mjd(self) -> float:
         """Modified Julian Date."""
-        return self.jd - float(CONSTANTS.MJD_OFFSET)
+        return self.jd - _MJD_OFFSET
     
-    @property
+    @cached_property
     def t_j2000(self) -> float:
         """Julian centuries since J2000.0."""
-        return (self.jd - float(CONSTANTS.JD_J2000)) / float(CONSTANTS.JULIAN_CENTURY)
+        return (self.jd - _JD_J2000) / _JULIAN_CENTURY
     
     @property
     def t_j2000_days(self) -> float:
         """Days since J2000.0."""
-        return self.jd - float(CONSTANTS.JD_J2000)
+        return self.jd - _JD_J2000
     
     def to_datetime(self, verbose: Optional[VerboseContext] = None) -> datetime:
         """
@@ -211,8 +299,15 @@ class JulianDate:
         
         Uses the IAU 2006 precession model.
         """
+        # Mean sidereal time at Greenwich in seconds (IAU 2006)
+        gmst_sec = _gmst_seconds(self.jd)
+        
+        if not verbose:
+            # % on floats is already floored, so this lands in [0, 24)
+            return (gmst_sec / 3600.0) % 24
+        
         # Julian centuries from J2000.0
-        t = self.t_j2000
+        t = (self.jd - _JD_J2000) / _JULIAN_CENTURY
         
         if verbose:
             step(verbose, "Julian centuries since J2000.0",
@@ -220,15 +315,6 @@ class JulianDate:
                  f"  = ({self.jd:.10f} - 2451545.0) / 36525\n"
                  f"  = {t:.12f}")
         
-        # Mean sidereal time at Greenwich in seconds
-        # IAU 2006 precession model
-        gmst_sec = (
-            67310.54841 +
-            (876600.0 * 3600 + 8640184.812866) * t +
-            0.093104 * t**2 -
-            6.2e-6 * t**3
-        )
-        
         if verbose:
             step(verbose, "GMST calculation (IAU 2006)",
                  f"θ = 67310.54841 + (876600×3600 + 8640184.812866)×T + 0.093104×T² − 6.2×10⁻⁶×T³\n"
@@ -238,8 +324,6 @@ class JulianDate:
         
         # Convert to hours and normalize
         gmst_hours = (gmst_sec / 3600.0) % 24
-        if gmst_hours < 0:
-            gmst_hours += 24
         
         if verbose:
             step(verbose, "Result",
@@ -268,9 +352,8 @@ class JulianDate:
             step(verbose, "Longitude correction",
                  f"Longitude = {longitude_deg:.6f}° = {lon_hours:.10f} hours")
         
+        # Float % takes the divisor's sign, so this is already in [0, 24)
         lst = (gmst + lon_hours) % 24
-        if lst < 0:
-            lst += 24
         
         if verbose:
             step(verbose, "Local Sidereal Time",
@@ -335,9 +418,9 @@ def jd_to_utc(jd: float, verbose: Optional[VerboseContext] = None) -> datetime:
 
 def mjd_to_jd(mjd: float) -> float:
     """Convert Modified Julian Date to Julian Date."""
-    return mjd + float(CONSTANTS.MJD_OFFSET)
+    return mjd + _MJD_OFFSET
 
 
 def jd_to_mjd(jd: float) -> float:
     """Convert Julian Date to Modified Julian Date."""
-    return jd - float(CONSTANTS.MJD_OFFSET)
+    return jd - _MJD_OFFSET
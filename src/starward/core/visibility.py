@@ -9,10 +9,10 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, List, Sequence, Tuple
 
-from starward.core.angles import Angle, angular_separation
-from starward.core.time import JulianDate, jd_now
+from starward.core.angles import Angle, _RAD_PER_DEG, angular_separation
+from starward.core.time import JulianDate, jd_now, _local_sidereal_degrees
 from starward.core.coords import ICRSCoord
 from starward.core.observer import Observer
 from starward.core.sun import solar_altitude, sun_position
@@ -62,6 +62,38 @@ class TargetVisibility:
     dark_windows: List[VisibilityWindow]
 
 
+@dataclass(frozen=True)
+class PlanningSnapshot:
+    """Where a target is now and at its next transit, for quick planning."""
+    
+    target: ICRSCoord
+    observer: Observer
+    date: JulianDate
+    
+    # Now
+    current_altitude: Angle
+    current_airmass: Optional[float]
+    
+    # At transit
+    transit_time: JulianDate
+    transit_altitude: Angle
+    transit_airmass: Optional[float]
+
+
+def _pickering_airmass(alt_deg: float) -> Optional[float]:
+    """
+    Pickering (2002) airmass for an altitude in degrees, None below horizon.
+    
+    Float kernel shared by airmass() and airmasses().
+    """
+    if alt_deg <= 0:
+        return None
+    sin_term = math.sin((alt_deg + 244.46 / (165.0 + 47.0 * alt_deg ** 1.1)) * _RAD_PER_DEG)
+    if sin_term <= 0:
+        return None
+    return 1.0 / sin_term
+
+
 def airmass(altitude: Angle, verbose: Optional[VerboseContext] = None) -> Optional[float]:
     """
     Calculate the airmass for a given altitude.
@@ -84,22 +116,51 @@ def airmass(altitude: Angle, verbose: Optional[VerboseContext] = None) -> Option
     
     # Pickering (2002) formula - accurate to horizon
     # X = 1 / sin(h + 244.46° / (165.0 + 47° × h^1.1))
-    h = alt_deg
-    denom_angle = 244.46 / (165.0 + 47.0 * (h ** 1.1))
-    sin_term = math.sin(math.radians(h + denom_angle))
-    
-    if sin_term <= 0:
-        return None
+    X = _pickering_airmass(alt_deg)
     
-    X = 1.0 / sin_term
-    
-    if verbose:
+    if verbose and X is not None:
         step(verbose, "Altitude", f"h = {alt_deg:.2f}°")
         step(verbose, "Airmass (Pickering)", f"X = {X:.3f}")
     
     return X
 
 
+def airmasses(altitudes: Sequence[Angle]) -> List[Optional[float]]:
+    """
+    Calculate the airmass for each of a sequence of altitudes.
+    
+    Element i is airmass(altitudes[i]); handy for sweeping a night or a
+    target list.
+    
+    Args:
+        altitudes: Altitudes above horizon
+        
+    Returns:
+        List of airmass values (None for any below horizon), in input order
+    """
+    return [_pickering_airmass(alt.degrees) for alt in altitudes]
+
+
+def _altitude_terms(target: ICRSCoord, observer: Observer) -> Tuple[float, float, float, float]:
+    """
+    Time-independent terms of the altitude formula for a target/observer pair.
+    
+    Returns (sin φ sin δ, cos φ cos δ, α in degrees, λ in degrees), so that
+    sin h = a + b cos H for any hour angle H.
+    """
+    dec_rad = math.radians(target.dec.degrees)
+    return (observer._sin_lat * math.sin(dec_rad),
+            observer._cos_lat * math.cos(dec_rad),
+            target.ra.degrees,
+            observer.lon_deg)
+
+
+def _altitude_degrees(a: float, b: float, ra_deg: float, lon_deg: float, jd: float) -> float:
+    """Altitude in degrees at a raw JD from terms precomputed by _altitude_terms()."""
+    H_rad = math.radians(_local_sidereal_degrees(jd, lon_deg) - ra_deg)
+    return math.degrees(math.asin(max(-1, min(1, a + b * math.cos(H_rad)))))
+
+
 def target_altitude(target: ICRSCoord, observer: Observer, jd: JulianDate,
                     verbose: Optional[VerboseContext] = None) -> Angle:
     """
@@ -114,15 +175,12 @@ def target_altitude(target: ICRSCoord, observer: Observer, jd: JulianDate,
     Returns:
         Altitude above/below horizon
     """
-    # Calculate local sidereal time
-    T = (jd.jd - 2451545.0) / 36525.0
-    theta0 = 280.46061837 + 360.98564736629 * (jd.jd - 2451545.0)
-    theta0 += 0.000387933 * T**2 - T**3 / 38710000.0
-    theta0 = theta0 % 360.0
+    # Observer latitude (trig cached on the Observer)
+    sin_phi, cos_phi = observer._sin_lat, observer._cos_lat
+    dec_rad = math.radians(target.dec.degrees)
     
     # Local sidereal time
-    lst = theta0 + observer.lon_deg
-    lst = lst % 360.0
+    lst = _local_sidereal_degrees(jd.jd, observer.lon_deg)
     
     if verbose:
         step(verbose, "Local sidereal time", f"θ = {lst:.4f}°")
@@ -134,13 +192,9 @@ def target_altitude(target: ICRSCoord, observer: Observer, jd: JulianDate,
     if verbose:
         step(verbose, "Hour angle", f"H = {H:.4f}°")
     
-    # Observer latitude
-    phi_rad = math.radians(observer.lat_deg)
-    dec_rad = math.radians(target.dec.degrees)
-    
     # Altitude formula
-    sin_alt = (math.sin(phi_rad) * math.sin(dec_rad) +
-               math.cos(phi_rad) * math.cos(dec_rad) * math.cos(H_rad))
+    sin_alt = (sin_phi * math.sin(dec_rad) +
+               cos_phi * math.cos(dec_rad) * math.cos(H_rad))
     
     alt = math.degrees(math.asin(max(-1, min(1, sin_alt))))
     
@@ -150,6 +204,60 @@ def target_altitude(target: ICRSCoord, observer: Observer, jd: JulianDate,
     return Angle(degrees=alt)
 
 
+def target_altitude_batch(target: ICRSCoord, observer: Observer,
+                          jds: Sequence[JulianDate]) -> List[Angle]:
+    """
+    Calculate the altitude of a target at each of a sequence of times.
+    
+    The observer and target terms are computed once and only the hour
+    angle changes from sample to sample.
+    
+    Args:
+        target: Target coordinates (ICRS)
+        observer: Observer location
+        jds: Julian Dates
+        
+    Returns:
+        List of altitudes, in the same order as jds
+    """
+    a, b, ra_deg, lon_deg = _altitude_terms(target, observer)
+    return [Angle(degrees=_altitude_degrees(a, b, ra_deg, lon_deg, t.jd)) for t in jds]
+
+
+def target_altitudes(targets: Sequence[ICRSCoord], observer: Observer,
+                     jd: JulianDate) -> List[Angle]:
+    """
+    Calculate the altitudes of several targets at one time and location.
+    
+    Element i is target_altitude(targets[i], observer, jd), evaluated on
+    raw floats.
+    
+    Args:
+        targets: Target coordinates (ICRS)
+        observer: Observer location
+        jd: Julian Date
+        
+    Returns:
+        List of altitudes, in the same order as targets
+    """
+    return [
+        Angle(degrees=_altitude_degrees(*_altitude_terms(target, observer), jd.jd))
+        for target in targets
+    ]
+
+
+def _azimuth_degrees(sin_phi: float, cos_phi: float, sin_dec: float, cos_dec: float,
+                     H_rad: float) -> float:
+    """Azimuth in degrees [0, 360) from precomputed latitude/declination terms."""
+    sin_az = -cos_dec * math.sin(H_rad)
+    cos_az = sin_dec * cos_phi - cos_dec * sin_phi * math.cos(H_rad)
+    
+    az = math.degrees(math.atan2(sin_az, cos_az))
+    if az < 0:
+        az += 360.0
+    return az
+
+
 def target_azimuth(target: ICRSCoord, observer: Observer, jd: JulianDate,
                    verbose: Optional[VerboseContext] = None) -> Angle:
     """
@@ -164,32 +272,16 @@ def target_azimuth(target: ICRSCoord, observer: Observer, jd: JulianDate,
     Returns:
         Azimuth (N=0°, E=90°)
     """
-    # Calculate local sidereal time
-    T = (jd.jd - 2451545.0) / 36525.0
-    theta0 = 280.46061837 + 360.98564736629 * (jd.jd - 2451545.0)
-    theta0 += 0.000387933 * T**2 - T**3 / 38710000.0
-    theta0 = theta0 % 360.0
-    
-    # Local sidereal time
-    lst = theta0 + observer.lon_deg
-    lst = lst % 360.0
-    
-    # Hour angle
-    H = lst - target.ra.degrees
-    H_rad = math.radians(H)
-    
-    # Observer latitude
-    phi_rad = math.radians(observer.lat_deg)
+    # Observer latitude (trig cached on the Observer)
+    sin_phi, cos_phi = observer._sin_lat, observer._cos_lat
     dec_rad = math.radians(target.dec.degrees)
+    sin_dec, cos_dec = math.sin(dec_rad), math.cos(dec_rad)
     
-    # Azimuth formula
-    sin_az = -math.cos(dec_rad) * math.sin(H_rad)
-    cos_az = (math.sin(dec_rad) * math.cos(phi_rad) -
-              math.cos(dec_rad) * math.sin(phi_rad) * math.cos(H_rad))
+    # Hour angle from local sidereal time
+    H_rad = math.radians(_local_sidereal_degrees(jd.jd, observer.lon_deg) - target.ra.degrees)
     
-    az = math.degrees(math.atan2(sin_az, cos_az))
-    if az < 0:
-        az += 360.0
+    # Azimuth formula
+    az = _azimuth_degrees(sin_phi, cos_phi, sin_dec, cos_dec, H_rad)
     
     if verbose:
         step(verbose, "Azimuth", f"A = {az:.4f}°")
@@ -197,6 +289,38 @@ def target_azimuth(target: ICRSCoord, observer: Observer, jd: JulianDate,
     return Angle(degrees=az)
 
 
+def target_azimuth_batch(target: ICRSCoord, observer: Observer,
+                         jds: Sequence[JulianDate]) -> List[Angle]:
+    """
+    Calculate the azimuth of a target at each of a sequence of times.
+    
+    Like target_altitude_batch(), the observer and target terms are shared
+    across samples.
+    
+    Args:
+        target: Target coordinates (ICRS)
+        observer: Observer location
+        jds: Julian Dates
+        
+    Returns:
+        List of azimuths (N=0°, E=90°), in the same order as jds
+    """
+    sin_phi, cos_phi = observer._sin_lat, observer._cos_lat
+    dec_rad = math.radians(target.dec.degrees)
+    sin_dec, cos_dec = math.sin(dec_rad), math.cos(dec_rad)
+    
+    ra_deg = target.ra.degrees
+    lon_deg = observer.lon_deg
+    
+    return [
+        Angle(degrees=_azimuth_degrees(
+            sin_phi, cos_phi, sin_dec, cos_dec,
+            math.radians(_local_sidereal_degrees(t.jd, lon_deg) - ra_deg)
+        ))
+        for t in jds
+    ]
+
+
 def transit_time(target: ICRSCoord, observer: Observer, jd: JulianDate,
                  verbose: Optional[VerboseContext] = None) -> JulianDate:
     """
@@ -242,33 +366,38 @@ def transit_time(target: ICRSCoord, observer: Observer, jd: JulianDate,
 
 
 def transit_altitude_calc(target: ICRSCoord, observer: Observer,
-                          verbose: Optional[VerboseContext] = None) -> Angle:
+                          verbose: Optional[VerboseContext] = None,
+                          lower: bool = False) -> Angle:
     """
-    Calculate the maximum altitude a target reaches at transit.
+    Calculate the altitude a target reaches on the meridian.
+    
+    Both culminations have closed forms, so no search is needed:
+    upper transit (the maximum) is h = 90° - |φ - δ| and lower transit
+    (the minimum, below the pole) is h = |φ + δ| - 90°. A target whose
+    lower transit altitude is positive is circumpolar.
     
     Args:
         target: Target coordinates (ICRS)
         observer: Observer location
         verbose: Optional verbose context
+        lower: Return the lower-culmination altitude instead
         
     Returns:
         Transit altitude
     """
-    # Transit altitude = 90° - |φ - δ| for targets that transit south of zenith
-    # Or = 90° + |φ - δ| - 180° = |φ - δ| - 90° for targets that transit north
-    
     phi = observer.lat_deg
     delta = target.dec.degrees
     
-    # For northern hemisphere observer:
-    # If δ > φ, target transits north of zenith
-    # If δ < φ, target transits south of zenith
-    
-    # General formula
-    alt_transit = 90.0 - abs(phi - delta)
+    if lower:
+        alt_transit = abs(phi + delta) - 90.0
+        formula = "h_lower = |φ + δ| - 90°"
+    else:
+        # Same form whether the target transits north or south of zenith
+        alt_transit = 90.0 - abs(phi - delta)
+        formula = "h_transit = 90° - |φ - δ|"
     
     if verbose:
-        step(verbose, "Transit altitude formula", f"h_transit = 90° - |φ - δ|")
+        step(verbose, "Transit altitude formula", formula)
         step(verbose, "Observer latitude", f"φ = {phi:.4f}°")
         step(verbose, "Target declination", f"δ = {delta:.4f}°")
         step(verbose, "Transit altitude", f"h = {alt_transit:.4f}°")
@@ -293,39 +422,43 @@ def target_rise_set(target: ICRSCoord, observer: Observer, jd: JulianDate,
         Tuple of (rise_time, set_time), either may be None
     """
     # Start from local midnight
-    jd_midnight = JulianDate(math.floor(jd.jd - 0.5) + 0.5 + observer.lon_deg / 360.0)
+    jd_midnight = math.floor(jd.jd - 0.5) + 0.5 + observer.lon_deg / 360.0
     
     if verbose:
         step(verbose, "Horizon altitude", f"h₀ = {horizon_altitude}°")
     
+    # The scan and both bisections only vary the time, so share the
+    # target/observer terms and work on raw JD floats throughout
+    a, b, ra_deg, lon_deg = _altitude_terms(target, observer)
+    
     # Search through the day
     dt = 0.01  # ~15 min steps
     
     rise_time = None
     set_time = None
     
-    prev_alt = target_altitude(target, observer, jd_midnight).degrees
+    prev_alt = _altitude_degrees(a, b, ra_deg, lon_deg, jd_midnight)
     
     for i in range(1, 120):  # Cover ~29 hours
-        test_jd = JulianDate(jd_midnight.jd + i * dt)
-        curr_alt = target_altitude(target, observer, test_jd).degrees
+        test_jd = jd_midnight + i * dt
+        curr_alt = _altitude_degrees(a, b, ra_deg, lon_deg, test_jd)
         
         # Rising
         if prev_alt < horizon_altitude <= curr_alt and rise_time is None:
             # Refine with bisection
-            jd1 = JulianDate(test_jd.jd - dt)
+            jd1 = test_jd - dt
             jd2 = test_jd
             
             for _ in range(15):
-                jd_mid = JulianDate((jd1.jd + jd2.jd) / 2)
-                mid_alt = target_altitude(target, observer, jd_mid).degrees
+                jd_mid = (jd1 + jd2) / 2
+                mid_alt = _altitude_degrees(a, b, ra_deg, lon_deg, jd_mid)
                 
                 if mid_alt < horizon_altitude:
                     jd1 = jd_mid
                 else:
                     jd2 = jd_mid
             
-            rise_time = JulianDate((jd1.jd + jd2.jd) / 2)
+            rise_time = JulianDate((jd1 + jd2) / 2)
             
             if verbose:
                 step(verbose, "Target rise", f"JD = {rise_time.jd:.6f}")
@@ -333,19 +466,19 @@ def target_rise_set(target: ICRSCoord, observer: Observer, jd: JulianDate,
         # Setting
         if prev_alt >= horizon_altitude > curr_alt and set_time is None:
             # Refine with bisection
-            jd1 = JulianDate(test_jd.jd - dt)
+            jd1 = test_jd - dt
             jd2 = test_jd
             
             for _ in range(15):
-                jd_mid = JulianDate((jd1.jd + jd2.jd) / 2)
-                mid_alt = target_altitude(target, observer, jd_mid).degrees
+                jd_mid = (jd1 + jd2) / 2
+                mid_alt = _altitude_degrees(a, b, ra_deg, lon_deg, jd_mid)
                 
                 if mid_alt >= horizon_altitude:
                     jd1 = jd_mid
                 else:
                     jd2 = jd_mid
             
-            set_time = JulianDate((jd1.jd + jd2.jd) / 2)
+            set_time = JulianDate((jd1 + jd2) / 2)
             
             if verbose:
                 step(verbose, "Target set", f"JD = {set_time.jd:.6f}")
@@ -471,6 +604,49 @@ def compute_visibility(target: ICRSCoord, observer: Observer, jd: JulianDate,
     )
 
 
+def planning_snapshot(target: ICRSCoord, observer: Observer, jd: JulianDate,
+                      verbose: Optional[VerboseContext] = None) -> PlanningSnapshot:
+    """
+    Altitude and airmass of a target now and at its transit.
+    
+    The target/observer terms of the altitude formula are computed once
+    and evaluated at both instants, instead of chaining target_altitude(),
+    transit_time() and airmass() calls that each redo that setup.
+    
+    Args:
+        target: Target coordinates (ICRS)
+        observer: Observer location
+        jd: Julian Date ("now")
+        verbose: Optional verbose context
+        
+    Returns:
+        PlanningSnapshot with current and transit altitude/airmass
+    """
+    a, b, ra_deg, lon_deg = _altitude_terms(target, observer)
+    
+    alt_now = _altitude_degrees(a, b, ra_deg, lon_deg, jd.jd)
+    trans = transit_time(target, observer, jd, verbose)
+    alt_transit = _altitude_degrees(a, b, ra_deg, lon_deg, trans.jd)
+    
+    X_now = _pickering_airmass(alt_now)
+    X_transit = _pickering_airmass(alt_transit)
+    
+    if verbose:
+        step(verbose, "Current altitude", f"h = {alt_now:.4f}°, X = {X_now}")
+        step(verbose, "Altitude at transit", f"h = {alt_transit:.4f}°, X = {X_transit}")
+    
+    return PlanningSnapshot(
+        target=target,
+        observer=observer,
+        date=jd,
+        current_altitude=Angle(degrees=alt_now),
+        current_airmass=X_now,
+        transit_time=trans,
+        transit_altitude=Angle(degrees=alt_transit),
+        transit_airmass=X_transit,
+    )
+
+
 def observable_tonight(targets: List[ICRSCoord], observer: Observer, jd: JulianDate,
                        min_altitude: float = 30.0,
                        min_moon_sep: float = 30.0,
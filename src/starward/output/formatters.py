@@ -11,6 +11,12 @@ from typing import Any, Optional
 
 from starward.verbose import VerboseContext
 
+# Optional fast JSON encoder (pip install "starward[fast]")
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class Result:
@@ -42,25 +48,20 @@ class PlainFormatter(Formatter):
         self.show_verbose = show_verbose
         self.unicode = unicode
     
+    # Banner placed between the result and its verbose steps
+    _STEPS_HEADER = ("", "═" * 50, "  Calculation Steps", "═" * 50)
+    
     def format(self, result: Result) -> str:
-        lines = []
-        
         # Main result
-        if result.label:
-            lines.append(f"{result.label}: {result.value}{' ' + result.unit if result.unit else ''}")
-        else:
-            lines.append(f"{result.value}{' ' + result.unit if result.unit else ''}")
+        main = f"{result.value} {result.unit}" if result.unit else f"{result.value}"
+        lines = [f"{result.label}: {main}" if result.label else main]
         
         # Extra info
-        for key, value in result.extra.items():
-            lines.append(f"  {key}: {value}")
+        lines.extend(f"  {key}: {value}" for key, value in result.extra.items())
         
         # Verbose steps
         if self.show_verbose and result.verbose:
-            lines.append("")
-            lines.append("═" * 50)
-            lines.append("  Calculation Steps")
-            lines.append("═" * 50)
+            lines.extend(self._STEPS_HEADER)
             lines.append(result.verbose.format_steps())
         
         return '\n'.join(lines)
@@ -83,6 +84,16 @@ class JSONFormatter(Formatter):
         if result.verbose:
             data['steps'] = result.verbose.to_dict()
         
+        if orjson is not None:
+            # Datetimes and dataclasses go through default=str, as with json
+            option = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME |
+                      orjson.OPT_PASSTHROUGH_DATACLASS |
+                      (orjson.OPT_INDENT_2 if self.pretty else 0))
+            try:
+                return orjson.dumps(data, default=str, option=option).decode()
+            except TypeError:
+                pass    # e.g. integers beyond 64 bits, which json still writes
+        
         if self.pretty:
             return json.dumps(data, indent=2, default=str)
         return json.dumps(data, default=str)
@@ -181,18 +192,56 @@ class LaTeXFormatter(Formatter):
         self.document_class = document_class
         self.siunitx = siunitx
     
+    # Fixed document wrapper, shared by every call
+    _PREAMBLE = (
+        r"\documentclass{article}",
+        r"\usepackage{amsmath}",
+        r"\usepackage{amssymb}",
+    )
+    _BEGIN_DOCUMENT = (r"\begin{document}", "")
+    _END_DOCUMENT = ("", r"\end{document}")
+    
+    # Common units mapped to siunitx macros
+    _SI_UNITS = {
+        'deg': r'\si{\degree}',
+        '°': r'\si{\degree}',
+        'rad': r'\si{\radian}',
+        'arcsec': r'\si{\arcsecond}',
+        'arcmin': r'\si{\arcminute}',
+        'AU': r'\si{\astronomicalunit}',
+        'km': r'\si{\kilo\meter}',
+        'km/s': r'\si{\kilo\meter\per\second}',
+    }
+    
+    # Plain-text formula tokens and their LaTeX, applied in order
+    _FORMULA_REPLACEMENTS = (
+        ('sin', r'\sin'),
+        ('cos', r'\cos'),
+        ('tan', r'\tan'),
+        ('arcsin', r'\arcsin'),
+        ('arccos', r'\arccos'),
+        ('arctan', r'\arctan'),
+        ('sqrt', r'\sqrt'),
+        ('**2', '^{2}'),
+        ('**3', '^{3}'),
+        ('*', r' \times '),
+        ('/', r' / '),
+        ('pi', r'\pi'),
+        ('alpha', r'\alpha'),
+        ('delta', r'\delta'),
+        ('theta', r'\theta'),
+        ('lambda', r'\lambda'),
+        ('phi', r'\phi'),
+        ('°', r'^\circ'),
+    )
+    
     def format(self, result: Result) -> str:
         lines = []
         
         if self.document_class:
-            lines.extend([
-                r"\documentclass{article}",
-                r"\usepackage{amsmath}",
-                r"\usepackage{amssymb}",
-                r"\usepackage{siunitx}" if self.siunitx else "",
-                r"\begin{document}",
-                ""
-            ])
+            lines.extend(self._PREAMBLE)
+            lines.append(r"\usepackage{siunitx}" if self.siunitx else "")
+            lines.extend(self._BEGIN_DOCUMENT)
         
         # Format the main result
         latex_value = self._to_latex(result.value)
@@ -216,19 +265,15 @@ class LaTeXFormatter(Formatter):
             lines.append(r"\subsection*{Calculation Steps}")
             lines.append(r"\begin{align*}")
             
-            for i, step in enumerate(result.verbose._steps):
-                label, formula = step.label, step.value
+            for step in result.verbose.steps:
                 # Clean up the formula for LaTeX
-                latex_formula = self._formula_to_latex(str(formula))
-                lines.append(f"  \\text{{{label}}} &= {latex_formula} \\\\")
+                latex_formula = self._formula_to_latex(step.content)
+                lines.append(f"  \\text{{{step.title}}} &= {latex_formula} \\\\")
             
             lines.append(r"\end{align*}")
         
         if self.document_class:
-            lines.extend([
-                "",
-                r"\end{document}"
-            ])
+            lines.extend(self._END_DOCUMENT)
         
         return '\n'.join(lines)
     
@@ -266,47 +311,14 @@ class LaTeXFormatter(Formatter):
             return ""
         
         if self.siunitx:
-            # Map common units to siunitx
-            unit_map = {
-                'deg': r'\si{\degree}',
-                '°': r'\si{\degree}',
-                'rad': r'\si{\radian}',
-                'arcsec': r'\si{\arcsecond}',
-                'arcmin': r'\si{\arcminute}',
-                'AU': r'\si{\astronomicalunit}',
-                'km': r'\si{\kilo\meter}',
-                'km/s': r'\si{\kilo\meter\per\second}',
-            }
-            return " " + unit_map.get(unit, f"\\,\\mathrm{{{unit}}}")
+            return " " + self._SI_UNITS.get(unit, f"\\,\\mathrm{{{unit}}}")
         
         return f" \\,\\mathrm{{{unit}}}"
     
     def _formula_to_latex(self, formula: str) -> str:
         """Convert a formula string to proper LaTeX."""
-        # Replace common patterns
-        replacements = [
-            ('sin', r'\sin'),
-            ('cos', r'\cos'),
-            ('tan', r'\tan'),
-            ('arcsin', r'\arcsin'),
-            ('arccos', r'\arccos'),
-            ('arctan', r'\arctan'),
-            ('sqrt', r'\sqrt'),
-            ('**2', '^{2}'),
-            ('**3', '^{3}'),
-            ('*', r' \times '),
-            ('/', r' / '),
-            ('pi', r'\pi'),
-            ('alpha', r'\alpha'),
-            ('delta', r'\delta'),
-            ('theta', r'\theta'),
-            ('lambda', r'\lambda'),
-            ('phi', r'\phi'),
-            ('°', r'^\circ'),
-        ]
-        
         result = formula
-        for old, new in replacements:
+        for old, new in self._FORMULA_REPLACEMENTS:
             result = result.replace(old, new)
         
         return result
@@ -392,6 +404,16 @@ def format_table_latex(headers: list, rows: list, caption: str = None) -> str:
     return '\n'.join(lines)
 
 
+# Output format name -> formatter factory taking the verbose flag; only the
+# selected formatter is built per call.
+_FORMATTER_FACTORIES = {
+    'plain': PlainFormatter,
+    'json': lambda verbose: JSONFormatter(),
+    'rich': RichFormatter,
+    'latex': LaTeXFormatter,
+}
+
+
 def format_output(
     result: Result,
     output_format: str = 'plain',
@@ -408,12 +430,5 @@ def format_output(
     Returns:
         Formatted string
     """
-    formatters = {
-        'plain': PlainFormatter(show_verbose=verbose),
-        'json': JSONFormatter(),
-        'rich': RichFormatter(show_verbose=verbose),
-        'latex': LaTeXFormatter(show_verbose=verbose),
-    }
-    
-    formatter = formatters.get(output_format, PlainFormatter(show_verbose=verbose))
-    return formatter.format(result)
+    factory = _FORMATTER_FACTORIES.get(output_format, PlainFormatter)
+    return factory(verbose).format(result)
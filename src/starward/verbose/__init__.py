@@ -7,10 +7,14 @@ The "show your work" engine that makes starward educational and debuggable.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 from contextlib import contextmanager
 
 
+# Closing rule drawn under every step
+_STEP_FOOTER = "└" + "─" * 40
+
+
 @dataclass
 class Step:
     """A single calculation step."""
@@ -51,32 +55,28 @@ class VerboseContext:
         finally:
             self._level -= 1
     
+    def _lines(self) -> Iterator[str]:
+        """Yield the rendered box-drawing lines for every step."""
+        for step in self.steps:
+            indent = "  " * step.level
+            yield f"{indent}┌─ {step.title}"
+            if step.content:
+                body = f"{indent}│  "
+                for line in step.content.split('\n'):
+                    yield body + line
+            yield indent + _STEP_FOOTER
+    
     def print_steps(self, printer: Optional[Callable[[str], None]] = None) -> None:
         """Print all steps."""
         if printer is None:
             printer = print
         
-        for step in self.steps:
-            indent = "  " * step.level
-            printer(f"{indent}┌─ {step.title}")
-            if step.content:
-                for line in step.content.split('\n'):
-                    printer(f"{indent}│  {line}")
-            printer(f"{indent}└{'─' * 40}")
+        for line in self._lines():
+            printer(line)
     
     def format_steps(self) -> str:
         """Format all steps as a string."""
-        lines = []
-        
-        for step in self.steps:
-            indent = "  " * step.level
-            lines.append(f"{indent}┌─ {step.title}")
-            if step.content:
-                for line in step.content.split('\n'):
-                    lines.append(f"{indent}│  {line}")
-            lines.append(f"{indent}└{'─' * 40}")
-        
-        return '\n'.join(lines)
+        return '\n'.join(self._lines())
     
     def to_dict(self) -> list[dict]:
         """Convert steps to list of dicts (for JSON output)."""
@@ -0,0 +1,13 @@
+"""
+JSON parsing for test assertions.
+
+Uses orjson when it is installed (the ``fast`` extra) and falls back to the
+standard library otherwise, so minimal installs still run the suite.
+"""
+
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+__all__ = ["loads"]
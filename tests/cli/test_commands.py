@@ -10,19 +10,20 @@
 from __future__ import annotations
 
 import allure
+import click
 import pytest
 from click.testing import CliRunner
 
-from starward.cli import main
+from starward.cli import LAZY_COMMANDS, main
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  TEST FIXTURES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner (stateless, so shared across the module)."""
     return CliRunner()
 
 
@@ -54,6 +55,18 @@ class TestMainCommand:
         with allure.step("Output contains version"):
             assert '0.' in result.output
 
+    @allure.title("Lazy command groups resolve by name and alias")
+    def test_lazy_commands_resolve(self):
+        """Every lazily imported group is listed and resolvable."""
+        ctx = click.Context(main)
+        with allure.step("All lazy groups appear in the command list"):
+            assert set(LAZY_COMMANDS) <= set(main.list_commands(ctx))
+        with allure.step("Each group resolves to the named click group"):
+            for name in LAZY_COMMANDS:
+                assert main.get_command(ctx, name).name == name
+        with allure.step("Aliases resolve through the same loader"):
+            assert main.get_command(ctx, 'const').name == 'constants'
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  TIME COMMANDS
@@ -24,6 +24,8 @@ Architecture:
 
 from __future__ import annotations
 
+import contextlib
+import os
 import pytest
 import platform
 import shutil
@@ -39,6 +41,17 @@ try:
 except ImportError:
     ALLURE_AVAILABLE = False
 
+# STARWARD_NO_ALLURE=1 strips the Allure instrumentation for runs that publish
+# no report. Test modules are imported after this conftest, so the decorators
+# they apply at import time already see the pass-through versions.
+if ALLURE_AVAILABLE and os.environ.get("STARWARD_NO_ALLURE") == "1":
+    def _passthrough(*args, **kwargs):
+        return lambda obj: obj
+
+    allure.step = lambda *args, **kwargs: contextlib.nullcontext()
+    allure.title = allure.story = allure.description = _passthrough
+    ALLURE_AVAILABLE = False
+
 
 # =============================================================================
 # Custom Test Output
@@ -101,6 +114,10 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "roundtrip: tests transform/inverse-transform identity")
     config.addinivalue_line("markers", "edge: tests edge cases and boundary conditions")
     config.addinivalue_line("markers", "verbose: tests verbose output functionality")
+    config.addinivalue_line(
+        "markers",
+        "benchmark: performance gates, deselected by default (run with 'make test-bench')",
+    )
 
 
 # =============================================================================
@@ -179,6 +196,25 @@ Pytest.Version={pytest.__version__}
         shutil.copy(categories_src, allure_dir / "categories.json")
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _disable_allure_steps_if_not_reporting(request):
+    """
+    Turn allure.step into a null context when no report is being written.
+
+    Without --alluredir every ``with allure.step(...)`` still builds a step
+    context and fires plugin hooks for nothing; swapping in
+    contextlib.nullcontext keeps that scaffolding out of the timings.
+    """
+    if not ALLURE_AVAILABLE or request.config.getoption("--alluredir", None):
+        yield
+        return
+
+    original_step = allure.step
+    allure.step = lambda *args, **kwargs: contextlib.nullcontext()
+    yield
+    allure.step = original_step
+
+
 # =============================================================================
 # Allure Fixture Decorator Helper
 # =============================================================================
@@ -194,25 +230,25 @@ def allure_title(title: str):
 # Tolerance Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 @allure_title("Angle Tolerance (0.1 arcsec)")
 def angle_tolerance():
     """Tolerance for angle comparisons (arcseconds)."""
     return 0.1  # 0.1 arcsecond
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 @allure_title("Time Tolerance (1.0 sec)")
 def time_tolerance():
     """Tolerance for time comparisons (seconds)."""
     return 1.0  # 1 second
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 @allure_title("Position Tolerance (0.01 deg)")
 def position_tolerance():
     """Tolerance for position comparisons (degrees)."""
     return 0.01  # ~36 arcseconds
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 @allure_title("Distance Tolerance (0.1%)")
 def distance_tolerance():
     """Tolerance for distance comparisons (relative)."""
@@ -312,6 +348,25 @@ def known_dates():
         'apollo11': JulianDate(2440423.5),        # 1969-07-20
     }
 
+@pytest.fixture(scope="session")
+@allure_title("Day Sweep (3-hour steps)")
+def jd_sweep():
+    """One day sampled every 3 hours from JD 2460000.5 (8 epochs, immutable)."""
+    from starward.core.time import JulianDate
+    return tuple(JulianDate(2460000.5 + h / 24) for h in range(0, 24, 3))
+
+@pytest.fixture(scope="session")
+@allure_title("Fixed 'Now' (JD 2460500.5)")
+def jd_now_fixed():
+    """
+    Stand-in for jd_now() shared by the whole session.
+
+    Pinning 'now' keeps results reproducible run to run and lets the
+    per-JD sun/moon position caches hit across tests.
+    """
+    from starward.core.time import JulianDate
+    return JulianDate(2460500.5)
+
 
 # =============================================================================
 # Observer Fixtures
@@ -396,11 +451,12 @@ def verbose_context():
 # Assertion Helpers
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def assert_angle_close():
     """Assert two angles are close within tolerance."""
+    from starward.core.angles import Angle
+
     def _assert(angle1, angle2, atol_arcsec=0.1, msg=""):
-        from starward.core.angles import Angle
         if isinstance(angle1, Angle):
             angle1 = angle1.degrees
         if isinstance(angle2, Angle):
@@ -409,11 +465,12 @@ def assert_angle_close():
         assert abs(angle1 - angle2) < atol_deg, f"{msg}: {angle1}° != {angle2}° (tol: {atol_arcsec}\")"
     return _assert
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def assert_coord_close():
     """Assert two coordinates are close."""
+    from starward.core.angles import angular_separation
+
     def _assert(coord1, coord2, atol_arcsec=1.0, msg=""):
-        from starward.core.angles import angular_separation
         sep = angular_separation(coord1.ra, coord1.dec, coord2.ra, coord2.dec)
         atol_deg = atol_arcsec / 3600.0
         assert sep.degrees < atol_deg, f"{msg}: separation {sep.degrees*3600:.2f}\" > {atol_arcsec}\""
@@ -441,7 +498,7 @@ STANDARD_LONGITUDES = [-180, -120, -60, 0, 60, 120, 180]
 # CLI Test Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cli_runner():
     """Click CLI test runner."""
     from click.testing import CliRunner
@@ -14,7 +14,10 @@ import allure
 import pytest
 from hypothesis import given, strategies as st, settings
 
-from starward.core.angles import Angle, angular_separation, position_angle
+from starward.core.angles import (
+    Angle, angular_separation, angular_separation_batch, position_angle,
+    separation_and_position_angle,
+)
 from starward.verbose import VerboseContext
 
 
@@ -212,6 +215,15 @@ class TestAngleConstruction:
         with allure.step(f"Result: {a.degrees}°"):
             assert math.isclose(a.degrees, 360.0, rel_tol=1e-10)
 
+    @pytest.mark.edge
+    @allure.title("Edge case: negative zero hours keeps its sign")
+    def test_from_hms_negative_zero_hours(self):
+        """-0h30m is negative, matching from_dms's handling of -0°."""
+        with allure.step("Create Angle.from_hms(-0.0, 30, 0)"):
+            a = Angle.from_hms(-0.0, 30, 0)
+        with allure.step(f"Result: {a.hours}h (should be -0.5h)"):
+            assert math.isclose(a.hours, -0.5, rel_tol=1e-10)
+
     # ─── Validation ─────────────────────────────────────────────────────────
 
     @allure.title("Must specify exactly one unit")
@@ -228,6 +240,30 @@ class TestAngleConstruction:
             with pytest.raises(ValueError, match="Exactly one"):
                 Angle(degrees=45, radians=0.5)
 
+    # ─── Storage ────────────────────────────────────────────────────────────
+
+    @allure.title("Angle is slotted and immutable")
+    def test_slotted_and_frozen(self):
+        """Angle has no instance __dict__ and rejects attribute assignment."""
+        a = Angle(degrees=45)
+        with allure.step("Verify no per-instance __dict__"):
+            assert not hasattr(a, '__dict__')
+        with allure.step("Verify assignment raises"):
+            with pytest.raises(AttributeError):
+                a._radians = 0.0
+
+    @allure.title("Angle survives copy and pickle")
+    def test_copy_and_pickle_roundtrip(self):
+        """Copies and unpickled angles keep both cached units."""
+        import copy
+        import pickle
+
+        a = Angle(degrees=123.456)
+        for label, b in (("deepcopy", copy.deepcopy(a)), ("pickle", pickle.loads(pickle.dumps(a)))):
+            with allure.step(f"{label}: {b.degrees}°"):
+                assert b.radians == a.radians
+                assert b.degrees == a.degrees
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  PARSING
@@ -413,6 +449,25 @@ class TestAngleConversions:
             assert m == 30
             assert math.isclose(s, 0.0, abs_tol=1e-10)
 
+    # ─── Formatting ─────────────────────────────────────────────────────────
+
+    @allure.title("Whole hours format without a 60-second carry")
+    @pytest.mark.parametrize("h", range(24))
+    def test_format_hms_whole_hours(self, h):
+        """Angle(hours=h).format_hms() is exactly h hours for every integer h."""
+        with allure.step(f"Format Angle(hours={h})"):
+            text = Angle(hours=h).format_hms()
+        with allure.step(f"Result: {text}"):
+            assert text == f"{h}ʰ 00ᵐ 00.00ˢ"
+
+    @allure.title("Whole degrees format without a 60-arcsecond carry")
+    def test_format_dms_carry(self):
+        """Seconds that round to 60 carry into the minutes and degrees."""
+        with allure.step("Format Angle(degrees=-(1 - 1e-9))"):
+            text = Angle(degrees=-(1 - 1e-9)).format_dms()
+        with allure.step(f"Result: {text}"):
+            assert text == "-1° 00′ 00.00″"
+
     # ─── Property Accessors ─────────────────────────────────────────────────
 
     @allure.title("Radians accessor (180° = π)")
@@ -842,6 +897,32 @@ class TestAngularSeparation:
         with allure.step(f"Result: {sep.degrees}°"):
             assert math.isclose(sep.degrees, 180, rel_tol=1e-10)
 
+    @pytest.mark.edge
+    @allure.title("Milliarcsecond separations are resolved")
+    def test_tiny_separation_precision(self):
+        """No acos-style cancellation: 1 mas apart at Dec 30° reads back as 1 mas."""
+        with allure.step("Two points 1 mas apart in declination"):
+            ra = Angle(hours=3)
+            sep = angular_separation(
+                ra, Angle(degrees=30),
+                ra, Angle(degrees=30) + Angle(arcseconds=1e-3)
+            )
+        with allure.step(f"Result: {sep.arcseconds:.6e}\""):
+            assert math.isclose(sep.arcseconds, 1e-3, rel_tol=1e-6)
+
+    @pytest.mark.edge
+    @allure.title("Nearly antipodal separations are resolved")
+    def test_near_antipodal_precision(self):
+        """180° − 1″ on the equator is not rounded to 180°."""
+        with allure.step("Two equatorial points 180° − 1″ apart"):
+            dec = Angle(degrees=0)
+            sep = angular_separation(
+                Angle(degrees=0), dec,
+                Angle(degrees=180) - Angle(arcseconds=1), dec
+            )
+        with allure.step(f"Shortfall from 180°: {(180 - sep.degrees) * 3600:.6f}\""):
+            assert math.isclose((180 - sep.degrees) * 3600, 1.0, rel_tol=1e-6)
+
     @pytest.mark.golden
     @allure.title("Sirius to Betelgeuse separation ≈ 27°")
     @allure.description("""
@@ -878,6 +959,38 @@ class TestAngularSeparation:
         with allure.step(f"Steps recorded: {len(ctx.steps)}"):
             assert len(ctx.steps) > 0
 
+    @pytest.mark.verbose
+    @allure.title("Verbose and quiet paths agree")
+    def test_verbose_matches_quiet(self):
+        """The verbose walkthrough returns the same separation as the fast path."""
+        points = (Angle(hours=12), Angle(degrees=45), Angle(hours=13), Angle(degrees=46))
+        with allure.step("Calculate separation with and without verbose"):
+            quiet = angular_separation(*points)
+            loud = angular_separation(*points, verbose=VerboseContext())
+        with allure.step(f"Separation = {quiet.degrees:.10f}°"):
+            assert quiet.radians == loud.radians
+
+    @allure.title("Batch separation matches pairwise calls")
+    def test_batch_matches_pairwise(self):
+        """angular_separation_batch() agrees element-wise with angular_separation()."""
+        ra1 = [Angle(hours=h) for h in (0, 6, 12, 18.5)]
+        dec1 = [Angle(degrees=d) for d in (0, 45, -30, 89.9)]
+        ra2 = [Angle(hours=h) for h in (6, 6, 0, 6.25)]
+        dec2 = [Angle(degrees=d) for d in (0, 46, 30, -89.9)]
+        with allure.step("Separate four pairs in one call"):
+            seps = angular_separation_batch(ra1, dec1, ra2, dec2)
+        with allure.step("Each matches the scalar function"):
+            assert len(seps) == 4
+            for sep, args in zip(seps, zip(ra1, dec1, ra2, dec2)):
+                assert sep.radians == angular_separation(*args).radians
+
+    @allure.title("Batch separation rejects mismatched lengths")
+    def test_batch_length_mismatch(self):
+        """Sequences of different lengths raise ValueError."""
+        a = Angle(degrees=0)
+        with pytest.raises(ValueError):
+            angular_separation_batch([a, a], [a, a], [a], [a])
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  POSITION ANGLE
@@ -944,6 +1057,45 @@ class TestPositionAngle:
             assert math.isclose(pa.degrees, 270, abs_tol=1)
 
 
+    @pytest.mark.verbose
+    @allure.title("Verbose and quiet paths agree")
+    def test_verbose_matches_quiet(self):
+        """The verbose walkthrough returns the same PA as the fast path."""
+        points = (Angle(hours=12), Angle(degrees=45), Angle(hours=11.5), Angle(degrees=40))
+        with allure.step("Calculate PA with and without verbose"):
+            quiet = position_angle(*points)
+            loud = position_angle(*points, verbose=VerboseContext())
+        with allure.step(f"PA = {quiet.degrees:.10f}°"):
+            assert quiet.radians == loud.radians
+
+
+    @allure.title("Combined separation and PA match the separate calls")
+    def test_combined_matches_separate(self):
+        """separation_and_position_angle() agrees with both scalar functions."""
+        points = (
+            Angle(hours=10.5), Angle(degrees=30),
+            Angle(hours=10 + 35 / 60), Angle(degrees=31),
+        )
+        with allure.step("Compute both in one call"):
+            sep, pa = separation_and_position_angle(*points)
+        with allure.step(f"sep = {sep.degrees:.6f}°, PA = {pa.degrees:.4f}°"):
+            assert sep.radians == angular_separation(*points).radians
+            assert pa.radians == position_angle(*points).radians
+
+    @allure.title("Combined result is bit-identical across the sky")
+    @given(
+        st.floats(min_value=0, max_value=360), st.floats(min_value=-90, max_value=90),
+        st.floats(min_value=0, max_value=360), st.floats(min_value=-90, max_value=90),
+    )
+    @settings(max_examples=200)
+    def test_combined_bit_identical(self, ra1, dec1, ra2, dec2):
+        """Both results equal the scalar functions exactly for random pairs."""
+        points = (Angle(degrees=ra1), Angle(degrees=dec1), Angle(degrees=ra2), Angle(degrees=dec2))
+        sep, pa = separation_and_position_angle(*points)
+        assert sep.radians == angular_separation(*points).radians
+        assert pa.radians == position_angle(*points).radians
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  PROPERTY-BASED TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -242,6 +242,25 @@ class TestConstantSearch:
             assert len(all_constants) > 10
             assert all(isinstance(c, Constant) for c in all_constants)
 
+    @allure.title("list_all() matches the class attributes")
+    def test_list_all_matches_attributes(self):
+        """The prebuilt index covers every Constant attribute exactly once."""
+        with allure.step("Collect Constant attributes from the class"):
+            expected = [getattr(CONSTANTS, n) for n in dir(CONSTANTS)
+                        if isinstance(getattr(CONSTANTS, n), Constant)]
+        with allure.step(f"{len(expected)} constants, same order"):
+            assert CONSTANTS.list_all() == expected
+
+    @allure.title("list_all() returns a fresh list each call")
+    def test_list_all_is_a_copy(self):
+        """Mutating the returned list does not affect later calls."""
+        with allure.step("Clear one result, fetch again"):
+            first = CONSTANTS.list_all()
+            count = len(first)
+            first.clear()
+        with allure.step(f"Second call still has {count} constants"):
+            assert len(CONSTANTS.list_all()) == count
+
     @allure.title("Search finds constants by name")
     def test_search_by_name(self):
         """Search finds constants by name."""
@@ -267,6 +286,16 @@ class TestConstantSearch:
         with allure.step(f"SOLAR={len(results1)}, solar={len(results2)}"):
             assert len(results1) == len(results2)
 
+    @allure.title("Search matches substrings, not just whole words")
+    def test_search_substring(self):
+        """A partial word still matches, and results are fresh lists."""
+        with allure.step("Search 'sol' twice"):
+            first = CONSTANTS.search("sol")
+            first.clear()
+            results = CONSTANTS.search("sol")
+        with allure.step(f"Found {len(results)} result(s), same as 'solar'"):
+            assert results == CONSTANTS.search("solar")
+
     @allure.title("Search with no matches returns empty")
     def test_search_no_match(self):
         """Search with no matches returns empty list."""
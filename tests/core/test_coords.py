@@ -15,7 +15,8 @@ import pytest
 from hypothesis import given, strategies as st, settings
 
 from starward.core.coords import (
-    ICRSCoord, GalacticCoord, HorizontalCoord, transform_coords
+    ICRSCoord, GalacticCoord, HorizontalCoord, transform_coords,
+    icrs_to_galactic_batch, galactic_to_icrs_batch,
 )
 from starward.core.angles import Angle
 from starward.core.time import JulianDate
@@ -96,6 +97,37 @@ class TestICRSCoord:
         with allure.step(f"Dec = {coord.dec.degrees}° (expected < 0)"):
             assert coord.dec.degrees < 0
 
+    @allure.title("Parse coordinate with colon-separated RA as hours")
+    def test_parse_colon_ra_is_hms(self):
+        """Colon-separated RA is read as H:M:S, Dec as D:M:S."""
+        with allure.step("Parse '12:30:00 +45:30:00'"):
+            coord = ICRSCoord.parse("12:30:00 +45:30:00")
+
+        with allure.step(f"RA = {coord.ra.hours}h (expected 12.5)"):
+            assert math.isclose(coord.ra.hours, 12.5, rel_tol=1e-10)
+
+        with allure.step(f"Dec = {coord.dec.degrees}° (expected 45.5)"):
+            assert math.isclose(coord.dec.degrees, 45.5, rel_tol=1e-10)
+
+    @allure.title("Malformed colon-separated RA raises ValueError")
+    def test_parse_colon_ra_malformed(self):
+        """A colon RA without three fields is rejected."""
+        with allure.step("Parse '12:30 +45:30:00' → ValueError"):
+            with pytest.raises(ValueError, match="Cannot parse"):
+                ICRSCoord.parse("12:30 +45:30:00")
+
+    @allure.title("Repeated parse of the same string is cached")
+    def test_parse_is_cached(self):
+        """Parsing an identical string is served from the parse cache."""
+        with allure.step("Parse '05h55m10.3s +07d24m25s' twice"):
+            first = ICRSCoord.parse("05h55m10.3s +07d24m25s")
+            hits = ICRSCoord.parse.cache_info().hits
+            second = ICRSCoord.parse("05h55m10.3s +07d24m25s")
+
+        with allure.step("Verify the second parse was a cache hit"):
+            assert ICRSCoord.parse.cache_info().hits == hits + 1
+            assert second == first
+
     # ─── Validation ─────────────────────────────────────────────────────────
 
     @allure.title("Declination > 90° raises ValueError")
@@ -464,6 +496,48 @@ class TestICRSToHorizontal:
         with allure.step(f"Azimuth = {horiz.az.degrees:.2f}° (expected ≈0° or ≈360°)"):
             assert horiz.az.degrees < 1 or horiz.az.degrees > 359
 
+    @allure.title("Celestial poles map straight to alt = ±latitude")
+    def test_celestial_poles_exact(self):
+        """NCP is due north at alt = lat, SCP due south at alt = -lat."""
+        with allure.step("Set up observer at 33°S"):
+            jd = JulianDate(2460123.25)
+            lat = Angle(degrees=-33.0)
+            lon = Angle(degrees=151.0)
+
+        with allure.step("Transform both poles"):
+            ncp = HorizontalCoord.from_icrs(ICRSCoord.from_degrees(0, 90), jd=jd, lat=lat, lon=lon)
+            scp = HorizontalCoord.from_icrs(ICRSCoord.from_degrees(0, -90), jd=jd, lat=lat, lon=lon)
+
+        with allure.step(f"NCP alt = {ncp.alt.degrees}°, az = {ncp.az.degrees}°"):
+            assert ncp.alt.degrees == -33.0
+            assert ncp.az.degrees == 0.0
+
+        with allure.step(f"SCP alt = {scp.alt.degrees}°, az = {scp.az.degrees}°"):
+            assert scp.alt.degrees == 33.0
+            assert scp.az.degrees == 180.0
+
+    @allure.title("Quiet (matrix) and verbose (trig) transforms agree")
+    def test_quiet_matches_verbose(self):
+        """The rotation-matrix fast path matches the step-by-step path."""
+        with allure.step("Set up observer at 34°N, 118°W and three targets"):
+            jd = JulianDate(2460123.25)
+            lat = Angle(degrees=34.0)
+            lon = Angle(degrees=-118.0)
+            targets = [
+                ICRSCoord.from_degrees(10.68, 41.27),
+                ICRSCoord.from_degrees(83.82, -5.39),
+                ICRSCoord.from_degrees(279.23, 38.78),
+            ]
+
+        for coord in targets:
+            quiet = HorizontalCoord.from_icrs(coord, jd=jd, lat=lat, lon=lon)
+            shown = HorizontalCoord.from_icrs(
+                coord, jd=jd, lat=lat, lon=lon, verbose=VerboseContext()
+            )
+            with allure.step(f"Alt/Az = {quiet.alt.degrees:.6f}°, {quiet.az.degrees:.6f}°"):
+                assert math.isclose(quiet.alt.radians, shown.alt.radians, abs_tol=1e-12)
+                assert math.isclose(quiet.az.radians, shown.az.radians, abs_tol=1e-12)
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  TRANSFORM_COORDS INTERFACE
@@ -573,6 +647,34 @@ class TestKnownObjects:
         with allure.step(f"b = {gal.b.degrees:.2f}° (expected ≈{b_exp}°)"):
             assert math.isclose(gal.b.degrees, b_exp, abs_tol=1.0)
 
+    @pytest.mark.golden
+    @allure.title("Batch ICRS → Galactic matches per-star conversion")
+    def test_star_galactic_coords_batch(self):
+        """Convert all known stars in one call and round-trip them back."""
+        stars = [
+            ("Vega", (18, 36, 56, 38, 47, 1), 67.45, 19.24),
+            ("Polaris", (2, 31, 49, 89, 15, 51), 123.28, 26.46),
+        ]
+
+        with allure.step(f"Convert {len(stars)} stars to Galactic in one call"):
+            coords = [ICRSCoord.from_hms_dms(*hms_dms) for _, hms_dms, _, _ in stars]
+            gals = icrs_to_galactic_batch(coords)
+
+        for (name, _, l_exp, b_exp), coord, gal in zip(stars, coords, gals):
+            single = coord.to_galactic()
+            with allure.step(f"{name}: l = {gal.l.degrees:.2f}°, b = {gal.b.degrees:.2f}°"):
+                assert gal.l.radians == single.l.radians
+                assert gal.b.radians == single.b.radians
+                assert math.isclose(gal.l.degrees, l_exp, abs_tol=1.0)
+                assert math.isclose(gal.b.degrees, b_exp, abs_tol=1.0)
+
+        with allure.step("Convert back to ICRS in one call"):
+            back = galactic_to_icrs_batch(gals)
+
+        for coord, icrs in zip(coords, back):
+            assert math.isclose(icrs.ra.radians, coord.ra.radians, abs_tol=1e-9)
+            assert math.isclose(icrs.dec.radians, coord.dec.radians, abs_tol=1e-9)
+
     @allure.title("Verify Sirius coordinates from fixture")
     def test_sirius_coordinates(self, famous_stars):
         """Verify Sirius coordinates from fixture."""
@@ -17,7 +17,7 @@ from starward.core.angles import Angle
 from starward.core.time import JulianDate, jd_now
 from starward.core.observer import Observer
 from starward.core.moon import (
-    moon_position, moon_phase, moon_altitude,
+    moon_position, moon_positions, moon_phase, moon_altitude,
     moonrise, moonset, next_phase,
     MoonPhase, MoonPosition, MoonPhaseInfo
 )
@@ -137,6 +137,31 @@ class TestMoonPosition:
         with allure.step(f"Parallax = {pos.parallax.degrees:.3f}° (expected 0.85-1.05°)"):
             assert 0.85 < pos.parallax.degrees < 1.05
 
+    @allure.title("Repeated quiet calls reuse the cached position")
+    def test_cached_position_matches_verbose(self):
+        """Quiet calls are memoized per JD and agree with the verbose path."""
+        from starward.verbose import VerboseContext
+
+        with allure.step("Calculate moon position twice at the same JD"):
+            jd = JulianDate(2460000.5)
+            first = moon_position(jd)
+            second = moon_position(JulianDate(2460000.5))
+
+        with allure.step("Verify second call returns the cached object"):
+            assert second is first
+
+        with allure.step("Verify verbose path computes the same position"):
+            assert moon_position(jd, verbose=VerboseContext()) == first
+
+    @allure.title("moon_positions() matches scalar calls")
+    def test_batch_matches_scalar(self, jd_sweep):
+        """moon_positions() gives one position per JD, in order."""
+        with allure.step("Calculate moon positions across the day sweep"):
+            batch = moon_positions(jd_sweep)
+
+        with allure.step("Compare against one-at-a-time calls"):
+            assert batch == [moon_position(jd) for jd in jd_sweep]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  MOON PHASE
@@ -217,6 +242,19 @@ class TestMoonPhase:
         with allure.step(f"Phase name = '{phase.phase_name.value}'"):
             assert phase.phase_name.value in valid_names
 
+    @allure.title("Phase names follow the phase-angle octants")
+    def test_phase_name_matches_octant(self):
+        """Each named phase covers the 45° octant centred on its nominal angle."""
+        phases = list(MoonPhase)
+        with allure.step("Sample one synodic month in 6-hour steps"):
+            for i in range(0, 4 * 30):
+                info = moon_phase(JulianDate(2460320.5 + i / 4))
+                centre = phases.index(info.phase_name) * 45.0
+                offset = (info.phase_angle % 360 - centre + 180.0) % 360.0 - 180.0
+                assert -22.5 <= offset < 22.5, (
+                    f"{info.phase_name.value} at phase angle {info.phase_angle:.2f}°"
+                )
+
 
 @allure.story("Moon Phase Illumination")
 class TestMoonPhaseIllumination:
@@ -17,7 +17,7 @@ from starward.core.angles import Angle
 from starward.core.time import JulianDate, jd_now
 from starward.core.observer import Observer
 from starward.core.sun import (
-    sun_position, sunrise, sunset, solar_noon,
+    sun_position, sun_positions, sunrise, sunset, solar_noon,
     civil_twilight, nautical_twilight, astronomical_twilight,
     solar_altitude, day_length, SunPosition
 )
@@ -128,6 +128,31 @@ class TestSunPosition:
                 with allure.step(f"Day +{offset}: EoT = {pos.equation_of_time:.2f} min"):
                     assert -17 < pos.equation_of_time < 18
 
+    @allure.title("Repeated quiet calls reuse the cached position")
+    def test_cached_position_matches_verbose(self):
+        """Quiet calls are memoized per JD and agree with the verbose path."""
+        from starward.verbose import VerboseContext
+
+        with allure.step("Calculate sun position twice at the same JD"):
+            jd = JulianDate(2460000.5)
+            first = sun_position(jd)
+            second = sun_position(JulianDate(2460000.5))
+
+        with allure.step("Verify second call returns the cached object"):
+            assert second is first
+
+        with allure.step("Verify verbose path computes the same position"):
+            assert sun_position(jd, verbose=VerboseContext()) == first
+
+    @allure.title("sun_positions() matches scalar calls")
+    def test_batch_matches_scalar(self, jd_sweep):
+        """sun_positions() gives one position per JD, in order."""
+        with allure.step("Calculate sun positions across the day sweep"):
+            batch = sun_positions(jd_sweep)
+
+        with allure.step("Compare against one-at-a-time calls"):
+            assert batch == [sun_position(jd) for jd in jd_sweep]
+
 
 @allure.story("Sun Position Seasons")
 class TestSunPositionSeasons:
@@ -432,6 +457,19 @@ class TestSolarAltitude:
                 with allure.step(f"+{offset}h: altitude = {alt.degrees:.2f}°"):
                     assert -90 <= alt.degrees <= 90
 
+    @allure.title("Quiet and verbose solar altitude agree")
+    def test_quiet_matches_verbose(self, greenwich, paranal):
+        """The float-only altitude kernel matches the step-by-step calculation."""
+        from starward.verbose import VerboseContext
+
+        for observer in (greenwich, paranal):
+            for offset in range(0, 24, 6):
+                jd = JulianDate(2460000.5 + offset / 24)
+                quiet = solar_altitude(observer, jd)
+                loud = solar_altitude(observer, jd, verbose=VerboseContext())
+                with allure.step(f"{observer.name} +{offset}h: {quiet.degrees:.4f}°"):
+                    assert quiet.degrees == pytest.approx(loud.degrees, abs=1e-8)
+
     @pytest.mark.golden
     @allure.title("Summer noon altitude at Greenwich ≈ 62°")
     @allure.description("""
@@ -98,6 +98,19 @@ class TestJulianDateConstruction:
         with allure.step(f"Diff = {diff:.9f} days (expected {expected:.9f})"):
             assert math.isclose(diff, expected, abs_tol=1e-9)
 
+    @allure.title("Quiet and verbose calendar conversion agree exactly")
+    def test_from_calendar_verbose_matches_quiet(self):
+        """The memoized quiet path returns the same JD as the verbose path."""
+        with allure.step("Convert 1987-04-10 19:21:00 twice quietly, once verbosely"):
+            first = JulianDate.from_calendar(1987, 4, 10, 19, 21, 0)
+            again = JulianDate.from_calendar(1987, 4, 10, 19, 21, 0)
+            verbose = JulianDate.from_calendar(
+                1987, 4, 10, 19, 21, 0, verbose=VerboseContext()
+            )
+
+        with allure.step(f"JD = {first.jd} in all three"):
+            assert first.jd == again.jd == verbose.jd
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  KNOWN JULIAN DATES
@@ -127,6 +140,35 @@ class TestKnownJulianDates:
         with allure.step(f"JD = {jd.jd:.1f} (expected {expected_jd})"):
             assert math.isclose(jd.jd, expected_jd, rel_tol=1e-9)
 
+    @pytest.mark.golden
+    @allure.title("Batch conversion matches the known JD table")
+    def test_known_jd_values_batch(self):
+        """from_calendar_batch converts the whole table in one call."""
+        table = [
+            ((2000, 1, 1, 12, 0, 0), 2451545.0),
+            ((1858, 11, 17, 0, 0, 0), 2400000.5),
+            ((2024, 1, 1, 0, 0, 0), 2460310.5),
+            ((1999, 12, 31, 0, 0, 0), 2451543.5),
+            ((2100, 1, 1, 0, 0, 0), 2488069.5),
+            ((1970, 1, 1, 0, 0, 0), 2440587.5),
+        ]
+
+        with allure.step(f"Convert {len(table)} calendar rows"):
+            jds = JulianDate.from_calendar_batch([row for row, _ in table])
+
+        with allure.step("Each JD matches from_calendar and the known value"):
+            assert len(jds) == len(table)
+            for jd, (row, expected_jd) in zip(jds, table):
+                assert jd == JulianDate.from_calendar(*row)
+                assert math.isclose(jd.jd, expected_jd, rel_tol=1e-9)
+
+    @allure.title("Batch conversion rejects invalid dates")
+    def test_batch_invalid_date(self):
+        """An impossible calendar row raises ValueError."""
+        with allure.step("Convert 2023-02-30 → ValueError"):
+            with pytest.raises(ValueError):
+                JulianDate.from_calendar_batch([(2023, 2, 30, 0, 0, 0)])
+
     @pytest.mark.golden
     @allure.title("Sputnik launch: 1957-10-04")
     def test_historical_sputnik(self):
@@ -245,6 +287,21 @@ class TestModifiedJulianDate:
         with allure.step(f"MJD = {jd.mjd:.1f} (expected 51544.5)"):
             assert math.isclose(jd.mjd, 51544.5, rel_tol=1e-10)
 
+    @allure.title("Cached MJD does not affect equality or hashing")
+    def test_mjd_cached(self):
+        """Reading .mjd caches it without changing JD identity semantics."""
+        with allure.step("Create two JDs 2451545.0, read .mjd on one"):
+            jd = JulianDate(2451545.0)
+            fresh = JulianDate(2451545.0)
+            first = jd.mjd
+
+        with allure.step(f"MJD = {first} on repeated reads"):
+            assert jd.mjd == first == 51544.5
+
+        with allure.step("JDs still compare and hash equal"):
+            assert jd == fresh
+            assert hash(jd) == hash(fresh)
+
     @allure.title("Convert MJD to JD")
     def test_mjd_to_jd_function(self):
         """Convert MJD to JD."""
@@ -15,15 +15,18 @@ import pytest
 
 from starward.core.angles import Angle
 from starward.core.coords import ICRSCoord
-from starward.core.time import JulianDate, jd_now
+from starward.core.time import JulianDate
 from starward.core.observer import Observer
 from starward.core.visibility import (
-    airmass, target_altitude, target_azimuth,
+    airmass, airmasses, target_altitude, target_altitude_batch, target_altitudes,
+    target_azimuth, target_azimuth_batch,
     transit_time, transit_altitude_calc, target_rise_set,
     moon_target_separation, is_night, compute_visibility,
-    TargetVisibility
+    TargetVisibility, planning_snapshot
 )
 
+POLARIS = ICRSCoord.parse("02h31m49s +89d15m51s")
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  AIRMASS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -108,6 +111,19 @@ class TestAirmass:
         with allure.step("Verify X(1°) > X(5°)"):
             assert alt_1 > alt_5
 
+    @allure.title("airmasses() matches scalar airmass")
+    def test_batch_matches_scalar(self):
+        """airmasses() gives the same values as scalar calls."""
+        with allure.step("Build altitudes spanning below horizon to zenith"):
+            alts = [Angle(degrees=d) for d in (-5, 0, 1, 10, 30, 45, 90)]
+
+        with allure.step("Calculate airmass for the whole sequence"):
+            batch = airmasses(alts)
+
+        with allure.step("Compare against one-at-a-time calls"):
+            assert batch == [airmass(a) for a in alts]
+            assert batch[0] is None and batch[1] is None
+
     @allure.title("Airmass at 1° altitude is very large (>25)")
     def test_horizon_airmass(self):
         """Airmass at 1° altitude is very large."""
@@ -184,13 +200,13 @@ class TestTargetAltitude:
     """
 
     @allure.title("target_altitude() returns Angle")
-    def test_returns_angle(self, greenwich):
+    def test_returns_angle(self, greenwich, jd_now_fixed):
         """target_altitude() returns an Angle."""
         with allure.step("Create target at RA=0°, Dec=45°"):
             target = ICRSCoord.from_degrees(0, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate target altitude"):
             alt = target_altitude(target, greenwich, jd)
@@ -199,18 +215,44 @@ class TestTargetAltitude:
             assert isinstance(alt, Angle)
 
     @allure.title("Altitude in valid range [-90°, +90°]")
-    def test_altitude_range(self, greenwich):
+    def test_altitude_range(self, greenwich, jd_sweep):
         """Altitude is in [-90°, +90°]."""
         with allure.step("Create target at RA=0°, Dec=45°"):
             target = ICRSCoord.from_degrees(0, 45)
 
-        with allure.step("Sample altitude throughout the day"):
-            for offset in range(0, 24, 3):
-                jd = JulianDate(2460000.5 + offset / 24)
-                alt = target_altitude(target, greenwich, jd)
+        with allure.step("Sample altitude throughout the day in one call"):
+            alts = target_altitude_batch(target, greenwich, jd_sweep)
+
+        for i, alt in enumerate(alts):
+            with allure.step(f"+{3 * i}h: altitude = {alt.degrees:.2f}°"):
+                assert -90 <= alt.degrees <= 90
 
-                with allure.step(f"+{offset}h: altitude = {alt.degrees:.2f}°"):
-                    assert -90 <= alt.degrees <= 90
+    @allure.title("target_altitude_batch() matches scalar altitude")
+    def test_batch_matches_scalar(self, greenwich, jd_sweep):
+        """target_altitude_batch() gives the same altitudes as scalar calls."""
+        with allure.step("Create target at RA=0°, Dec=45°"):
+            target = ICRSCoord.from_degrees(0, 45)
+
+        with allure.step("Compare batch and one-at-a-time results"):
+            batch = target_altitude_batch(target, greenwich, jd_sweep)
+            assert len(batch) == len(jd_sweep)
+            for alt, jd in zip(batch, jd_sweep):
+                expected = target_altitude(target, greenwich, jd)
+                assert alt.degrees == pytest.approx(expected.degrees, abs=1e-9)
+
+    @allure.title("target_altitudes() matches per-target altitude")
+    def test_many_targets_match_scalar(self, greenwich, famous_stars):
+        """Altitudes of a target list agree with one call per target."""
+        with allure.step("Set reference date"):
+            jd = JulianDate(2460000.5)
+
+        with allure.step("Compare list and one-at-a-time results"):
+            targets = list(famous_stars.values())
+            alts = target_altitudes(targets, greenwich, jd)
+            assert len(alts) == len(targets)
+            for alt, target in zip(alts, targets):
+                expected = target_altitude(target, greenwich, jd)
+                assert alt.degrees == pytest.approx(expected.degrees, abs=1e-9)
 
 
 @allure.story("Target Azimuth")
@@ -220,13 +262,13 @@ class TestTargetAzimuth:
     """
 
     @allure.title("target_azimuth() returns Angle")
-    def test_returns_angle(self, greenwich):
+    def test_returns_angle(self, greenwich, jd_now_fixed):
         """target_azimuth() returns an Angle."""
         with allure.step("Create target at RA=0°, Dec=45°"):
             target = ICRSCoord.from_degrees(0, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate target azimuth"):
             az = target_azimuth(target, greenwich, jd)
@@ -235,18 +277,30 @@ class TestTargetAzimuth:
             assert isinstance(az, Angle)
 
     @allure.title("Azimuth in valid range [0°, 360°)")
-    def test_azimuth_range(self, greenwich):
+    def test_azimuth_range(self, greenwich, jd_sweep):
         """Azimuth is in [0°, 360°)."""
         with allure.step("Create target at RA=0°, Dec=45°"):
             target = ICRSCoord.from_degrees(0, 45)
 
-        with allure.step("Sample azimuth throughout the day"):
-            for offset in range(0, 24, 3):
-                jd = JulianDate(2460000.5 + offset / 24)
-                az = target_azimuth(target, greenwich, jd)
+        with allure.step("Sample azimuth throughout the day in one call"):
+            azs = target_azimuth_batch(target, greenwich, jd_sweep)
+
+        for i, az in enumerate(azs):
+            with allure.step(f"+{3 * i}h: azimuth = {az.degrees:.2f}°"):
+                assert 0 <= az.degrees < 360
+
+    @allure.title("target_azimuth_batch() matches scalar azimuth")
+    def test_batch_matches_scalar(self, greenwich, jd_sweep):
+        """target_azimuth_batch() gives the same azimuths as scalar calls."""
+        with allure.step("Create target at RA=0°, Dec=45°"):
+            target = ICRSCoord.from_degrees(0, 45)
 
-                with allure.step(f"+{offset}h: azimuth = {az.degrees:.2f}°"):
-                    assert 0 <= az.degrees < 360
+        with allure.step("Compare batch and one-at-a-time results"):
+            batch = target_azimuth_batch(target, greenwich, jd_sweep)
+            assert len(batch) == len(jd_sweep)
+            for az, jd in zip(batch, jd_sweep):
+                expected = target_azimuth(target, greenwich, jd)
+                assert az.degrees == pytest.approx(expected.degrees, abs=1e-9)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -263,13 +317,13 @@ class TestTransit:
     """
 
     @allure.title("transit_time() returns JulianDate")
-    def test_transit_time_returns_jd(self, greenwich):
+    def test_transit_time_returns_jd(self, greenwich, jd_now_fixed):
         """transit_time() returns JulianDate."""
         with allure.step("Create target at RA=0°, Dec=45°"):
             target = ICRSCoord.from_degrees(0, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate transit time"):
             transit = transit_time(target, greenwich, jd)
@@ -300,15 +354,34 @@ class TestTransit:
     """)
     def test_circumpolar_transit_altitude(self, greenwich):
         """For circumpolar stars, transit altitude = 90° - |lat - dec|."""
-        with allure.step("Parse Polaris coordinates: 02h31m49s +89d15m51s"):
-            polaris = ICRSCoord.parse("02h31m49s +89d15m51s")
-
-        with allure.step("Calculate transit altitude"):
-            max_alt = transit_altitude_calc(polaris, greenwich)
+        with allure.step("Calculate transit altitude of Polaris (02h31m49s +89d15m51s)"):
+            max_alt = transit_altitude_calc(POLARIS, greenwich)
 
         with allure.step(f"Transit altitude = {max_alt.degrees:.2f}° (expected 50-55°)"):
             assert 50 < max_alt.degrees < 55
 
+    @pytest.mark.edge
+    @allure.title("Lower culmination: circumpolar stays up, equator dips to nadir")
+    @allure.description("""
+    Lower transit altitude = |φ + δ| - 90°. At Greenwich, Polaris
+    (Dec +89.26°) bottoms out near 50.8°; from the equator a Dec 0° target
+    passes through the nadir (-90°).
+    """)
+    def test_lower_transit_altitude(self, greenwich, equator):
+        """Lower culmination uses the closed form |φ + δ| - 90°."""
+        with allure.step("Calculate Polaris lower transit at Greenwich"):
+            low = transit_altitude_calc(POLARIS, greenwich, lower=True)
+
+        with allure.step(f"Lower transit = {low.degrees:.2f}° (expected ≈ 50.8°, above horizon)"):
+            assert low.degrees == pytest.approx(
+                greenwich.lat_deg + POLARIS.dec.degrees - 90.0, abs=1e-9
+            )
+            assert 0 < low.degrees < transit_altitude_calc(POLARIS, greenwich).degrees
+
+        with allure.step("Equatorial target from the equator reaches the nadir"):
+            nadir = transit_altitude_calc(ICRSCoord.from_degrees(0, 0), equator, lower=True)
+            assert nadir.degrees == pytest.approx(-90.0, abs=1e-6)
+
     @allure.title("Altitude is maximum at transit")
     def test_altitude_highest_at_transit(self, greenwich):
         """Altitude is maximum at transit."""
@@ -355,13 +428,13 @@ class TestTargetRiseSet:
     """
 
     @allure.title("target_rise_set() returns (rise, set) tuple")
-    def test_rise_set_returns_tuple(self, greenwich):
+    def test_rise_set_returns_tuple(self, greenwich, jd_now_fixed):
         """target_rise_set() returns (rise, set) tuple."""
         with allure.step("Create target at RA=0°, Dec=20°"):
             target = ICRSCoord.from_degrees(0, 20)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate rise/set times"):
             result = target_rise_set(target, greenwich, jd)
@@ -392,6 +465,22 @@ class TestTargetRiseSet:
         with allure.step("Verify at least one event found"):
             assert rise is not None or set_t is not None
 
+    @allure.title("Rise/set times sit on the horizon altitude")
+    def test_events_on_horizon(self, greenwich):
+        """Bisected rise/set times agree with target_altitude() at the horizon."""
+        with allure.step("Create target on celestial equator (Dec=0°)"):
+            target = ICRSCoord.from_degrees(0, 0)
+
+        with allure.step("Calculate rise/set times for a 20° horizon"):
+            rise, set_t = target_rise_set(target, greenwich, JulianDate(2460000.5), 20.0)
+
+        for label, event in (("Rise", rise), ("Set", set_t)):
+            if event is None:
+                continue
+            alt = target_altitude(target, greenwich, event)
+            with allure.step(f"{label}: altitude = {alt.degrees:.4f}°"):
+                assert alt.degrees == pytest.approx(20.0, abs=0.01)
+
     @pytest.mark.edge
     @allure.title("Circumpolar objects never set")
     @allure.description("""
@@ -424,13 +513,13 @@ class TestMoonSeparation:
     """
 
     @allure.title("moon_target_separation() returns Angle")
-    def test_returns_angle(self):
+    def test_returns_angle(self, jd_now_fixed):
         """moon_target_separation() returns Angle."""
         with allure.step("Create target at RA=180°, Dec=45°"):
             target = ICRSCoord.from_degrees(180, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate Moon-target separation"):
             sep = moon_target_separation(target, jd)
@@ -439,13 +528,13 @@ class TestMoonSeparation:
             assert isinstance(sep, Angle)
 
     @allure.title("Moon separation in range [0°, 180°]")
-    def test_separation_range(self):
+    def test_separation_range(self, jd_now_fixed):
         """Separation is in [0°, 180°]."""
         with allure.step("Create target at RA=180°, Dec=45°"):
             target = ICRSCoord.from_degrees(180, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate Moon-target separation"):
             sep = moon_target_separation(target, jd)
@@ -465,10 +554,10 @@ class TestIsNight:
     """
 
     @allure.title("is_night() returns boolean")
-    def test_returns_bool(self, greenwich):
+    def test_returns_bool(self, greenwich, jd_now_fixed):
         """is_night() returns boolean."""
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Check if it's night"):
             result = is_night(greenwich, jd)
@@ -512,13 +601,13 @@ class TestComputeVisibility:
     """
 
     @allure.title("compute_visibility() returns TargetVisibility")
-    def test_returns_target_visibility(self, greenwich):
+    def test_returns_target_visibility(self, greenwich, jd_now_fixed):
         """compute_visibility() returns TargetVisibility dataclass."""
         with allure.step("Create target at RA=180°, Dec=45°"):
             target = ICRSCoord.from_degrees(180, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Compute full visibility"):
             vis = compute_visibility(target, greenwich, jd)
@@ -527,13 +616,13 @@ class TestComputeVisibility:
             assert isinstance(vis, TargetVisibility)
 
     @allure.title("Visibility includes current altitude")
-    def test_includes_altitude(self, greenwich):
+    def test_includes_altitude(self, greenwich, jd_now_fixed):
         """Result includes current altitude."""
         with allure.step("Create target at RA=180°, Dec=45°"):
             target = ICRSCoord.from_degrees(180, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Compute visibility"):
             vis = compute_visibility(target, greenwich, jd)
@@ -543,13 +632,13 @@ class TestComputeVisibility:
             assert isinstance(vis.current_altitude, Angle)
 
     @allure.title("Visibility includes airmass")
-    def test_includes_airmass(self, greenwich):
+    def test_includes_airmass(self, greenwich, jd_now_fixed):
         """Result includes airmass (or None if below horizon)."""
         with allure.step("Create target at RA=180°, Dec=45°"):
             target = ICRSCoord.from_degrees(180, 45)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Compute visibility"):
             vis = compute_visibility(target, greenwich, jd)
@@ -557,6 +646,21 @@ class TestComputeVisibility:
         with allure.step(f"Current airmass = {vis.current_airmass}"):
             assert hasattr(vis, 'current_airmass')
 
+    @allure.title("planning_snapshot() agrees with the individual calls")
+    def test_planning_snapshot_matches_calls(self, greenwich, jd_now_fixed):
+        """Snapshot fields match target_altitude/transit_time/airmass."""
+        with allure.step("Take a snapshot for Polaris"):
+            snap = planning_snapshot(POLARIS, greenwich, jd_now_fixed)
+
+        with allure.step(
+            f"Now {snap.current_altitude.degrees:.2f}°, "
+            f"transit {snap.transit_altitude.degrees:.2f}°"
+        ):
+            now = target_altitude(POLARIS, greenwich, jd_now_fixed)
+            assert snap.current_altitude.degrees == pytest.approx(now.degrees, abs=1e-9)
+            assert snap.transit_time.jd == transit_time(POLARIS, greenwich, jd_now_fixed).jd
+            assert snap.current_airmass == pytest.approx(airmass(now))
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  LATITUDE EFFECTS
@@ -569,13 +673,13 @@ class TestLatitudeEffects:
     """
 
     @allure.title("NCP always visible from North Pole")
-    def test_ncp_always_up_at_north_pole(self, north_pole):
+    def test_ncp_always_up_at_north_pole(self, north_pole, jd_now_fixed):
         """North Celestial Pole always visible from North Pole."""
         with allure.step("Create target at NCP (Dec=90°)"):
             ncp = ICRSCoord.from_degrees(0, 90)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate altitude at North Pole"):
             alt = target_altitude(ncp, north_pole, jd)
@@ -584,13 +688,13 @@ class TestLatitudeEffects:
             assert alt.degrees > 85
 
     @allure.title("SCP never visible from North Pole")
-    def test_scp_never_up_at_north_pole(self, north_pole):
+    def test_scp_never_up_at_north_pole(self, north_pole, jd_now_fixed):
         """South Celestial Pole never visible from North Pole."""
         with allure.step("Create target at SCP (Dec=-90°)"):
             scp = ICRSCoord.from_degrees(0, -90)
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Calculate altitude at North Pole"):
             alt = target_altitude(scp, north_pole, jd)
@@ -609,3 +713,54 @@ class TestLatitudeEffects:
 
         with allure.step(f"Transit altitude = {max_alt.degrees:.2f}° (expected > 85°)"):
             assert max_alt.degrees > 85
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  THROUGHPUT
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# One pass sweeps this many (target, time) pairs. There is no absolute
+# time budget: `make test-bench` fails on a >20% mean regression against
+# the saved baseline instead.
+ALTAZ_SAMPLES = 10_000
+
+
+@allure.story("Throughput")
+class TestAltAzThroughput:
+    """
+    Performance regression gate for the altitude pipeline.
+
+    Planning tools evaluate altitude over whole catalogs and dense time
+    grids, so the per-call cost of target_altitude() matters as much as its
+    accuracy. This benchmark sweeps random targets across one day.
+    """
+
+    @pytest.mark.slow
+    @pytest.mark.benchmark(group="altaz")
+    @allure.title("Altitude throughput for 10,000 (target, time) pairs")
+    def test_altaz_throughput(self, request, greenwich):
+        """Altitude throughput over 10,000 (target, jd) pairs."""
+        import random
+
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        with allure.step(f"Generate {ALTAZ_SAMPLES} random targets over one day"):
+            rng = random.Random(0)
+            targets = [
+                ICRSCoord.from_degrees(rng.uniform(0, 360), rng.uniform(-90, 90))
+                for _ in range(ALTAZ_SAMPLES)
+            ]
+            jds = [
+                JulianDate(2460000.5 + i / (ALTAZ_SAMPLES - 1))
+                for i in range(ALTAZ_SAMPLES)
+            ]
+
+        with allure.step("Benchmark altitude sweep"):
+            alts = benchmark(
+                lambda: [target_altitude(t, greenwich, jd) for t, jd in zip(targets, jds)]
+            )
+
+        with allure.step("Verify results"):
+            assert len(alts) == ALTAZ_SAMPLES
+            assert all(-90 <= a.degrees <= 90 for a in alts)
@@ -9,20 +9,24 @@
 
 from __future__ import annotations
 
+import math
 import allure
 import pytest
 
 from starward.core.angles import Angle
 from starward.core.coords import ICRSCoord
-from starward.core.time import JulianDate, jd_now
+from starward.core.time import JulianDate
 from starward.core.observer import Observer
-from starward.core.sun import sun_position, sunrise, sunset, solar_noon, solar_altitude
-from starward.core.moon import moon_position, moon_phase, MoonPhase
+from starward.core.sun import sun_positions, sunrise, sunset, solar_noon, solar_altitude
+from starward.core.moon import moon_positions, moon_phase, MoonPhase
 from starward.core.visibility import (
-    airmass, target_altitude, target_azimuth,
-    transit_time, compute_visibility
+    airmass, target_altitude, target_altitude_batch, target_altitudes, target_azimuth,
+    transit_time, compute_visibility, planning_snapshot
 )
 
+M31 = ICRSCoord.parse("00h42m44s +41d16m09s")
+VEGA = ICRSCoord.parse("18h36m56.3s +38d47m01s")
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  VISIBILITY WORKFLOW
@@ -39,13 +43,13 @@ class TestVisibilityWorkflow:
     Tests the full visibility calculation workflow for a deep sky target (M31).
     Validates that all visibility metrics are computed correctly.
     """)
-    def test_full_visibility_calculation(self, greenwich):
+    def test_full_visibility_calculation(self, greenwich, jd_now_fixed):
         """Test complete visibility calculation for a target."""
-        with allure.step("Parse M31 coordinates: 00h42m44s +41d16m09s"):
-            target = ICRSCoord.parse("00h42m44s +41d16m09s")
+        with allure.step("Target M31: 00h42m44s +41d16m09s"):
+            target = M31
 
-        with allure.step("Get current Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Compute full visibility"):
             vis = compute_visibility(target, greenwich, jd)
@@ -71,46 +75,40 @@ class TestVisibilityWorkflow:
     3. Compute airmass at transit
     4. Verify transit provides optimal viewing
     """)
-    def test_observation_planning_workflow(self, greenwich):
+    def test_observation_planning_workflow(self, greenwich, jd_now_fixed):
         """Test a typical observation planning workflow."""
-        with allure.step("Parse Vega coordinates: 18h36m56.3s +38d47m01s"):
-            target = ICRSCoord.parse("18h36m56.3s +38d47m01s")
-
-        with allure.step("Get current time"):
-            jd = jd_now()
+        with allure.step("Target Vega: 18h36m56.3s +38d47m01s"):
+            target = VEGA
 
-        with allure.step("Calculate current altitude"):
-            alt = target_altitude(target, greenwich, jd)
-            assert isinstance(alt, Angle)
-
-        with allure.step(f"Current altitude = {alt.degrees:.2f}°"):
-            pass
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
-        with allure.step("Calculate transit time"):
-            transit = transit_time(target, greenwich, jd)
-            assert isinstance(transit, JulianDate)
+        with allure.step("Take a planning snapshot (now and at transit)"):
+            snap = planning_snapshot(target, greenwich, jd)
+            assert isinstance(snap.current_altitude, Angle)
+            assert isinstance(snap.transit_time, JulianDate)
 
-        with allure.step(f"Transit JD = {transit.jd:.4f}"):
+        with allure.step(f"Current altitude = {snap.current_altitude.degrees:.2f}°"):
             pass
 
-        with allure.step("Calculate altitude at transit"):
-            alt_at_transit = target_altitude(target, greenwich, transit)
-
-        with allure.step(f"Transit altitude = {alt_at_transit.degrees:.2f}°"):
+        with allure.step(f"Transit JD = {snap.transit_time.jd:.4f}"):
             pass
 
-        with allure.step("Calculate airmass at transit"):
-            X = airmass(alt_at_transit)
+        with allure.step(f"Transit altitude = {snap.transit_altitude.degrees:.2f}°"):
+            assert snap.transit_altitude.degrees == pytest.approx(
+                target_altitude(target, greenwich, snap.transit_time).degrees, abs=1e-9
+            )
 
-        with allure.step(f"Transit airmass = {X:.3f}" if X != float('inf') else "Transit airmass = ∞"):
+        X = snap.transit_airmass
+        with allure.step(f"Transit airmass = {X:.3f}" if X is not None else "Transit airmass = ∞"):
             pass
 
         with allure.step("Verify transit has optimal airmass"):
-            if alt.degrees > 0:
-                X_now = airmass(alt)
-                with allure.step(f"Current airmass = {X_now:.3f}" if X_now != float('inf') else "Current airmass = ∞"):
+            if snap.current_altitude.degrees > 0:
+                X_now = snap.current_airmass
+                with allure.step(f"Current airmass = {X_now:.3f}"):
                     pass
-                assert X <= X_now or X_now == float('inf'), (
+                assert X <= X_now, (
                     f"Transit airmass {X} should be ≤ current {X_now}"
                 )
 
@@ -136,49 +134,27 @@ class TestSunMoonRelationship:
         from starward.core.angles import angular_separation
 
         with allure.step("Define test dates: New moon 2024-01-11, Full moon 2024-01-25"):
-            new_moon_jd = JulianDate(2460320.5)
-            full_moon_jd = JulianDate(2460334.5)
-
-        with allure.step("Calculate Sun/Moon positions at new moon"):
-            sun_new = sun_position(new_moon_jd)
-            moon_new = moon_position(new_moon_jd)
-
-        with allure.step(f"Sun RA = {sun_new.ra.degrees:.2f}°, Moon RA = {moon_new.ra.degrees:.2f}°"):
-            pass
-
-        with allure.step("Calculate elongation at new moon"):
-            elongation_new = angular_separation(
-                sun_new.ra, sun_new.dec,
-                moon_new.ra, moon_new.dec
+            jds = [JulianDate(2460320.5), JulianDate(2460334.5)]
+
+        with allure.step("Compute Sun/Moon elongation at new and full moon"):
+            suns = sun_positions(jds)
+            moons = moon_positions(jds)
+            elong_new, elong_full = (
+                angular_separation(sun.ra, sun.dec, moon.ra, moon.dec).degrees
+                for sun, moon in zip(suns, moons)
             )
 
-        with allure.step(f"New moon elongation = {elongation_new.degrees:.1f}°"):
+        with allure.step(f"New moon elongation = {elong_new:.1f}°, full moon = {elong_full:.1f}°"):
             pass
 
         with allure.step("Verify new moon elongation < 45°"):
-            assert elongation_new.degrees < 45, (
-                f"New moon elongation {elongation_new.degrees}° should be < 45°"
-            )
-
-        with allure.step("Calculate Sun/Moon positions at full moon"):
-            sun_full = sun_position(full_moon_jd)
-            moon_full = moon_position(full_moon_jd)
-
-        with allure.step(f"Sun RA = {sun_full.ra.degrees:.2f}°, Moon RA = {moon_full.ra.degrees:.2f}°"):
-            pass
-
-        with allure.step("Calculate elongation at full moon"):
-            elongation_full = angular_separation(
-                sun_full.ra, sun_full.dec,
-                moon_full.ra, moon_full.dec
+            assert elong_new < 45, (
+                f"New moon elongation {elong_new}° should be < 45°"
             )
 
-        with allure.step(f"Full moon elongation = {elongation_full.degrees:.1f}°"):
-            pass
-
         with allure.step("Verify full moon elongation > 135°"):
-            assert elongation_full.degrees > 135, (
-                f"Full moon elongation {elongation_full.degrees}° should be > 135°"
+            assert elong_full > 135, (
+                f"Full moon elongation {elong_full}° should be > 135°"
             )
 
 
@@ -299,20 +275,23 @@ class TestMultiTargetComparison:
     Calculates and compares the current altitude of multiple famous stars
     from Greenwich observatory.
     """)
-    def test_compare_target_altitudes(self, greenwich, famous_stars):
+    def test_compare_target_altitudes(self, greenwich, famous_stars, jd_now_fixed):
         """Compare altitudes of multiple targets."""
-        with allure.step("Get current time"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
+
+        with allure.step("Compute all altitudes in one call"):
+            alts = target_altitudes(list(famous_stars.values()), greenwich, jd)
 
         altitudes = {}
-        for name, coord in famous_stars.items():
-            alt = target_altitude(coord, greenwich, jd)
+        for name, alt in zip(famous_stars, alts):
             altitudes[name] = alt.degrees
             with allure.step(f"{name.capitalize()} altitude = {alt.degrees:.2f}°"):
                 pass
 
         with allure.step("Verify all altitudes are valid (-90° to +90°)"):
             for name, alt in altitudes.items():
+                assert math.isfinite(alt), f"{name} altitude is not finite"
                 assert -90 <= alt <= 90, f"{name} altitude {alt}° out of range"
 
     @allure.title("Polaris circumpolar from Greenwich")
@@ -320,10 +299,10 @@ class TestMultiTargetComparison:
     Verifies that Polaris (near celestial north pole) is circumpolar
     from Greenwich (51.5°N) - always above the horizon throughout the day.
     """)
-    def test_circumpolar_vs_rising_setting(self, greenwich, famous_stars):
+    def test_circumpolar_vs_rising_setting(self, greenwich, famous_stars, jd_now_fixed):
         """Test that Polaris is always up from Greenwich."""
-        with allure.step("Get base Julian Date"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         polaris = famous_stars.get('polaris')
         if polaris:
@@ -331,9 +310,11 @@ class TestMultiTargetComparison:
                 pass
 
             with allure.step("Check altitude throughout 24 hours"):
-                for hour in range(0, 24, 6):
-                    test_jd = JulianDate(jd.jd + hour / 24)
-                    alt = target_altitude(polaris, greenwich, test_jd)
+                hours = range(0, 24, 6)
+                test_jds = [JulianDate(jd.jd + hour / 24) for hour in hours]
+                alts = target_altitude_batch(polaris, greenwich, test_jds)
+
+                for hour, alt in zip(hours, alts):
                     with allure.step(f"+{hour}h: altitude = {alt.degrees:.2f}°"):
                         assert alt.degrees > 0, (
                             f"Polaris should be above horizon at +{hour}h, got {alt.degrees}°"
@@ -356,13 +337,13 @@ class TestCoordinateChain:
     to horizontal (alt-az) coordinates via an observer location.
     Also validates airmass calculation based on altitude.
     """)
-    def test_icrs_to_horizontal_via_observer(self, greenwich):
+    def test_icrs_to_horizontal_via_observer(self, greenwich, jd_now_fixed):
         """Test ICRS → Horizontal transformation chain."""
         with allure.step("Define ICRS target: RA=180.0°, Dec=45.0°"):
             target = ICRSCoord.from_degrees(180.0, 45.0)
 
-        with allure.step("Get current time"):
-            jd = jd_now()
+        with allure.step("Use the session Julian Date"):
+            jd = jd_now_fixed
 
         with allure.step("Transform to altitude"):
             alt = target_altitude(target, greenwich, jd)
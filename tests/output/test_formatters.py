@@ -10,11 +10,15 @@
 from __future__ import annotations
 
 import json
+from datetime import datetime, timezone
 import allure
 import pytest
 
+from starward.core.angles import Angle
+from starward.core.moon import MoonPhase
+from starward.verbose import VerboseContext
 from starward.output.formatters import (
-    PlainFormatter, JSONFormatter, LaTeXFormatter, Result
+    PlainFormatter, JSONFormatter, LaTeXFormatter, Result, format_output
 )
 
 
@@ -109,6 +113,62 @@ class TestJSONFormatter:
         with allure.step("Output has newlines"):
             assert '\n' in output
 
+    @pytest.mark.parametrize("pretty", [True, False])
+    @allure.title("orjson and stdlib json encode the same data")
+    def test_encoder_fallback_matches(self, monkeypatch, pretty):
+        """With or without orjson installed, the parsed output is identical."""
+        from starward.output import formatters
+
+        result = Result(
+            value=Angle(degrees=45.5), label="Angle", unit="°",
+            extra={
+                'ra': Angle(hours=12), 'n': 3, 'tiny': 6.2e-06,
+                'when': datetime(2024, 3, 20, 3, 6, tzinfo=timezone.utc),
+                'phase': MoonPhase.FULL_MOON, 'name': "Ångström °",
+                'list': [1.5e-07, (2, 'x')], 7: 'int key',
+            },
+            verbose=VerboseContext(),
+        )
+        result.verbose.add_step("Step", "θ = 1°")
+        with allure.step("Format with the active encoder"):
+            active = json.loads(JSONFormatter(pretty=pretty).format(result))
+        with allure.step("Format with the stdlib fallback"):
+            monkeypatch.setattr(formatters, "orjson", None)
+            fallback = json.loads(JSONFormatter(pretty=pretty).format(result))
+        with allure.step("Parsed documents are equal"):
+            assert active == fallback
+
+    @allure.title("stdlib fallback output is unchanged")
+    def test_stdlib_fallback_output(self, monkeypatch):
+        """Without orjson the bytes are exactly json.dumps(data, default=str)."""
+        from starward.output import formatters
+
+        monkeypatch.setattr(formatters, "orjson", None)
+        result = Result(value=float('nan'), label="X", unit="°")
+        with allure.step("Format without orjson"):
+            output = JSONFormatter(pretty=False).format(result)
+        with allure.step("Output matches json.dumps"):
+            expected = {'result': float('nan'), 'label': "X", 'unit': "°"}
+            assert output == json.dumps(expected, default=str)
+            assert "\\u00b0" in output
+
+    @allure.title("Datetimes are written through str() with either encoder")
+    def test_datetime(self):
+        """A datetime serializes as str(dt), space-separated."""
+        when = datetime(2024, 3, 20, 3, 6, tzinfo=timezone.utc)
+        with allure.step("Format result"):
+            parsed = json.loads(JSONFormatter().format(Result(value=when)))
+        with allure.step(f"result = {parsed['result']!r}"):
+            assert parsed['result'] == "2024-03-20 03:06:00+00:00"
+
+    @allure.title("Integers beyond 64 bits fall back to stdlib json")
+    def test_big_int(self):
+        """orjson rejects 2**70; the formatter still writes it."""
+        with allure.step("Format 2**70"):
+            parsed = json.loads(JSONFormatter().format(Result(value=2**70)))
+        with allure.step("Value round-trips"):
+            assert parsed['result'] == 2**70
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  LATEX FORMATTER
@@ -161,3 +221,59 @@ class TestLaTeXFormatter:
             output = formatter.format(result)
         with allure.step("Output contains 'siunitx'"):
             assert 'siunitx' in output
+
+    @allure.title("Verbose steps render as an align block")
+    def test_verbose_steps(self):
+        """Calculation steps are emitted inside align* when show_verbose is set."""
+        with allure.step("Create result with one recorded step"):
+            ctx = VerboseContext()
+            ctx.add_step("Separation", "sqrt(x**2)")
+            result = Result(value=1.0, label="Sep", verbose=ctx)
+        with allure.step("Format with show_verbose=True"):
+            output = LaTeXFormatter(show_verbose=True).format(result)
+        with allure.step("Output contains the step inside align*"):
+            assert r"\begin{align*}" in output
+            assert r"\text{Separation} &= \sqrt(x^{2})" in output
+
+    @allure.title("Verbose result from a real calculation renders to LaTeX")
+    def test_verbose_calculation(self):
+        """Every step of a verbose angular_separation() lands in the document."""
+        from starward.core.angles import angular_separation
+
+        with allure.step("Run angular_separation() with a verbose context"):
+            ctx = VerboseContext()
+            sep = angular_separation(Angle(hours=12), Angle(degrees=45),
+                                     Angle(hours=13), Angle(degrees=46), verbose=ctx)
+            result = Result(value=sep.degrees, label="Separation", unit="°", verbose=ctx)
+        with allure.step("Format as a full document with show_verbose=True"):
+            output = LaTeXFormatter(show_verbose=True, document_class=True).format(result)
+        with allure.step("One align row per recorded step"):
+            assert output.count(r"\text{") == len(ctx.steps)
+            for step in ctx.steps:
+                assert f"\\text{{{step.title}}} &= " in output
+            assert output.index(r"\begin{align*}") < output.index(r"\end{document}")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  FORMAT DISPATCH
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@allure.story("Format Dispatch")
+class TestFormatOutput:
+    """Tests for format_output() selecting a formatter by name."""
+
+    @allure.title("Named formats match their formatter")
+    def test_named_formats(self):
+        """'plain', 'json' and 'latex' match the formatter classes directly."""
+        result = Result(value=45.5, label="Angle", unit="deg")
+        with allure.step("Compare against direct formatter output"):
+            assert format_output(result, 'plain') == PlainFormatter().format(result)
+            assert format_output(result, 'json') == JSONFormatter().format(result)
+            assert format_output(result, 'latex') == LaTeXFormatter().format(result)
+
+    @allure.title("Unknown format falls back to plain")
+    def test_unknown_format_falls_back(self):
+        """An unrecognized format name renders as plain text."""
+        result = Result(value=45.5, label="Angle")
+        with allure.step("Format with 'xml'"):
+            assert format_output(result, 'xml') == PlainFormatter().format(result)
@@ -19,21 +19,29 @@
 
 from __future__ import annotations
 
-import json
 import allure
 import pytest
-from click.testing import CliRunner
 
-from starward import __version__
-from starward.cli import main
+from tests._json import loads
 
 
-@pytest.fixture
+# click.testing and the CLI are imported on first use rather than at module
+# scope, so collecting this file (e.g. under an unrelated -k) stays cheap.
+
+@pytest.fixture(scope='module')
 def runner():
-    """Create a CLI test runner for invoking commands."""
+    """Create a CLI test runner for invoking commands (stateless, so shared)."""
+    from click.testing import CliRunner
     return CliRunner()
 
 
+@pytest.fixture(scope='module')
+def main():
+    """The root starward command group."""
+    from starward.cli import main
+    return main
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #  CLI BASICS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -51,7 +59,7 @@ class TestCLIBasics:
     """
 
     @allure.title("--help shows usage")
-    def test_help(self, runner):
+    def test_help(self, runner, main):
         """
         Verify --help displays usage information.
 
@@ -66,7 +74,7 @@ class TestCLIBasics:
             assert 'starward' in result.output.lower()
 
     @allure.title("--version shows version")
-    def test_version(self, runner):
+    def test_version(self, runner, main):
         """
         Verify --version displays the current version.
 
@@ -77,11 +85,12 @@ class TestCLIBasics:
             result = runner.invoke(main, ['--version'])
         with allure.step(f"Exit code: {result.exit_code}"):
             assert result.exit_code == 0
+        from starward import __version__
         with allure.step(f"Version: {__version__}"):
             assert __version__ in result.output
 
     @allure.title("about command shows info")
-    def test_about(self, runner):
+    def test_about(self, runner, main):
         """
         Verify the about command displays project information.
 
@@ -116,7 +125,7 @@ class TestTimeCommands:
     """
 
     @allure.title("time now shows Julian Date")
-    def test_time_now(self, runner):
+    def test_time_now(self, runner, main):
         """
         Verify 'time now' displays the current Julian Date.
 
@@ -131,7 +140,7 @@ class TestTimeCommands:
             assert 'Julian Date' in result.output
 
     @allure.title("time now --json returns JSON")
-    def test_time_now_json(self, runner):
+    def test_time_now_json(self, runner, main):
         """
         Verify JSON output format for scripting integration.
 
@@ -143,13 +152,13 @@ class TestTimeCommands:
         with allure.step(f"Exit code: {result.exit_code}"):
             assert result.exit_code == 0
         with allure.step("Parse JSON output"):
-            data = json.loads(result.output)
+            data = loads(result.output)
         with allure.step(f"julian_date: {data.get('julian_date')}"):
             assert 'julian_date' in data
             assert 'utc' in data
 
     @allure.title("time convert converts JD to date")
-    def test_time_convert(self, runner):
+    def test_time_convert(self, runner, main):
         """
         Verify Julian Date to calendar date conversion.
 
@@ -164,7 +173,7 @@ class TestTimeCommands:
             assert '2000' in result.output
 
     @allure.title("time jd converts date to JD")
-    def test_time_jd(self, runner):
+    def test_time_jd(self, runner, main):
         """
         Verify calendar date to Julian Date conversion.
 
@@ -180,7 +189,7 @@ class TestTimeCommands:
             assert '2451545' in result.output
 
     @allure.title("time lst shows Local Sidereal Time")
-    def test_time_lst(self, runner):
+    def test_time_lst(self, runner, main):
         """
         Verify Local Sidereal Time calculation.
 
@@ -196,7 +205,7 @@ class TestTimeCommands:
             assert 'LST' in result.output
 
     @allure.title("'t' alias works for 'time'")
-    def test_time_alias(self, runner):
+    def test_time_alias(self, runner, main):
         """
         Verify command alias for faster typing.
 
@@ -229,7 +238,7 @@ class TestCoordsCommands:
     """
 
     @allure.title("coords parse parses coordinates")
-    def test_coords_parse(self, runner):
+    def test_coords_parse(self, runner, main):
         """
         Verify coordinate string parsing.
 
@@ -245,7 +254,7 @@ class TestCoordsCommands:
             assert 'Declination' in result.output
 
     @allure.title("coords transform to galactic")
-    def test_coords_transform_galactic(self, runner):
+    def test_coords_transform_galactic(self, runner, main):
         """
         Verify ICRS to Galactic coordinate transformation.
 
@@ -260,7 +269,7 @@ class TestCoordsCommands:
             assert 'Galactic' in result.output
 
     @allure.title("coords transform to altaz requires location")
-    def test_coords_transform_altaz_requires_location(self, runner):
+    def test_coords_transform_altaz_requires_location(self, runner, main):
         """
         Verify that alt-az transformation requires observer location.
 
@@ -275,7 +284,7 @@ class TestCoordsCommands:
             assert 'lat' in result.output.lower() or 'lon' in result.output.lower()
 
     @allure.title("coords transform to altaz with location")
-    def test_coords_transform_altaz(self, runner):
+    def test_coords_transform_altaz(self, runner, main):
         """
         Verify horizontal coordinate transformation with location.
 
@@ -296,7 +305,7 @@ class TestCoordsCommands:
             assert 'Alt' in result.output
 
     @allure.title("coords parse --json returns JSON")
-    def test_coords_json(self, runner):
+    def test_coords_json(self, runner, main):
         """
         Verify JSON output for coordinate data.
 
@@ -308,13 +317,13 @@ class TestCoordsCommands:
         with allure.step(f"Exit code: {result.exit_code}"):
             assert result.exit_code == 0
         with allure.step("Parse JSON output"):
-            data = json.loads(result.output)
+            data = loads(result.output)
         with allure.step(f"ra: {data.get('ra')}, dec: {data.get('dec')}"):
             assert 'ra' in data
             assert 'dec' in data
 
     @allure.title("'c' alias works for 'coords'")
-    def test_coords_alias(self, runner):
+    def test_coords_alias(self, runner, main):
         """
         Verify short alias for coords command.
 
@@ -347,7 +356,7 @@ class TestAnglesCommands:
     """
 
     @allure.title("angles sep calculates separation")
-    def test_angles_sep(self, runner):
+    def test_angles_sep(self, runner, main):
         """
         Verify angular separation calculation.
 
@@ -362,7 +371,7 @@ class TestAnglesCommands:
             assert 'Separation' in result.output
 
     @allure.title("angles pa calculates position angle")
-    def test_angles_pa(self, runner):
+    def test_angles_pa(self, runner, main):
         """
         Verify position angle calculation.
 
@@ -378,7 +387,7 @@ class TestAnglesCommands:
             assert 'Position Angle' in result.output
 
     @allure.title("angles convert converts degrees")
-    def test_angles_convert(self, runner):
+    def test_angles_convert(self, runner, main):
         """
         Verify angle unit conversion.
 
@@ -394,7 +403,7 @@ class TestAnglesCommands:
             assert 'Radians' in result.output
 
     @allure.title("angles convert from radians")
-    def test_angles_convert_radians(self, runner):
+    def test_angles_convert_radians(self, runner, main):
         """
         Verify conversion from radian input.
 
@@ -409,7 +418,7 @@ class TestAnglesCommands:
             assert '90' in result.output
 
     @allure.title("angles convert --json returns JSON")
-    def test_angles_json(self, runner):
+    def test_angles_json(self, runner, main):
         """
         Verify JSON output for angle conversions.
 
@@ -421,13 +430,13 @@ class TestAnglesCommands:
         with allure.step(f"Exit code: {result.exit_code}"):
             assert result.exit_code == 0
         with allure.step("Parse JSON output"):
-            data = json.loads(result.output)
+            data = loads(result.output)
         with allure.step(f"degrees: {data.get('degrees')}, radians: {data.get('radians')}"):
             assert 'degrees' in data
             assert 'radians' in data
 
     @allure.title("'a' alias works for 'angles'")
-    def test_angles_alias(self, runner):
+    def test_angles_alias(self, runner, main):
         """
         Verify short alias for angles command.
 
@@ -461,7 +470,7 @@ class TestConstantsCommands:
     """
 
     @allure.title("constants list shows all constants")
-    def test_constants_list(self, runner):
+    def test_constants_list(self, runner, main):
         """
         Verify listing all available constants.
 
@@ -476,7 +485,7 @@ class TestConstantsCommands:
             assert 'Speed of light' in result.output
 
     @allure.title("constants search finds matches")
-    def test_constants_search(self, runner):
+    def test_constants_search(self, runner, main):
         """
         Verify searching for constants by keyword.
 
@@ -491,7 +500,7 @@ class TestConstantsCommands:
             assert 'Solar' in result.output
 
     @allure.title("constants show displays constant")
-    def test_constants_show(self, runner):
+    def test_constants_show(self, runner, main):
         """
         Verify displaying a specific constant's details.
 
@@ -506,7 +515,7 @@ class TestConstantsCommands:
             assert 'Astronomical Unit' in result.output
 
     @allure.title("constants show --json returns JSON")
-    def test_constants_json(self, runner):
+    def test_constants_json(self, runner, main):
         """
         Verify JSON output for constant values.
 
@@ -518,12 +527,29 @@ class TestConstantsCommands:
         with allure.step(f"Exit code: {result.exit_code}"):
             assert result.exit_code == 0
         with allure.step("Parse JSON output"):
-            data = json.loads(result.output)
+            data = loads(result.output)
         with allure.step(f"value: {data.get('value')}"):
             assert 'value' in data
 
+    @allure.title("Repeated constants show returns identical JSON")
+    def test_constants_json_repeated(self, runner, main):
+        """
+        Verify memoized constant rendering is stable across invocations.
+
+        Constant responses are cached per (name, format); a second call
+        must produce byte-identical output.
+        """
+        args = ['-o', 'json', 'constants', 'show', 'AU']
+        with allure.step("Run 'starward -o json constants show AU' twice"):
+            first = runner.invoke(main, args)
+            second = runner.invoke(main, args)
+        with allure.step("Outputs match"):
+            assert first.exit_code == second.exit_code == 0
+            assert first.output == second.output
+            assert loads(second.output)['name'] == 'Astronomical Unit'
+
     @allure.title("'const' alias works for 'constants'")
-    def test_constants_alias(self, runner):
+    def test_constants_alias(self, runner, main):
         """
         Verify short alias for constants command.
 
@@ -554,7 +580,7 @@ class TestVerboseMode:
     """
 
     @allure.title("--verbose time now shows steps")
-    def test_verbose_time(self, runner):
+    def test_verbose_time(self, runner, main):
         """
         Verify verbose output for time calculations.
 
@@ -570,7 +596,7 @@ class TestVerboseMode:
             assert '─' in result.output
 
     @allure.title("--verbose coords transform shows steps")
-    def test_verbose_coords(self, runner):
+    def test_verbose_coords(self, runner, main):
         """
         Verify verbose output for coordinate transformations.
 
@@ -585,7 +611,7 @@ class TestVerboseMode:
             assert '─' in result.output
 
     @allure.title("--verbose angles sep shows steps")
-    def test_verbose_angles(self, runner):
+    def test_verbose_angles(self, runner, main):
         """
         Verify verbose output for angular separation.
 